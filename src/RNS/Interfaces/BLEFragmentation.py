@@ -40,6 +40,7 @@ Fragment Types:
 
 import time
 import struct
+import threading
 
 # Import RNS for logging
 try:
@@ -57,6 +58,8 @@ class BLEFragmenter:
     fragment count to enable reassembly on the receiving end.
     """
 
+    __slots__ = ("mtu", "payload_size")
+
     # Fragment types
     TYPE_START = 0x01
     TYPE_CONTINUE = 0x02
@@ -65,6 +68,9 @@ class BLEFragmenter:
     # Header size
     HEADER_SIZE = 5  # 1 byte type + 2 bytes sequence + 2 bytes total
 
+    # Header of a packet that fits in one fragment (START, sequence 0, total 1)
+    SINGLE_FRAGMENT_HEADER = struct.pack("!BHH", TYPE_START, 0, 1)
+
     def __init__(self, mtu=185):
         """
         Initialize fragmenter.
@@ -72,13 +78,25 @@ class BLEFragmenter:
         Args:
             mtu: Maximum transmission unit for BLE (default 185 for BLE 4.2)
         """
-        self.mtu = max(mtu, 20)  # Minimum 20 bytes for BLE
+        self.set_mtu(mtu)
+
+    def set_mtu(self, mtu):
+        """
+        Update the MTU in place (e.g. after MTU renegotiation).
+
+        Args:
+            mtu: Maximum transmission unit for BLE
+        """
+        mtu = max(mtu, 20)  # Minimum 20 bytes for BLE
         # Data payload per fragment = MTU - header
-        self.payload_size = self.mtu - self.HEADER_SIZE
+        payload_size = mtu - self.HEADER_SIZE
 
-        if self.payload_size < 1:
+        if payload_size < 1:
             raise ValueError(f"MTU {mtu} too small for fragmentation (min {self.HEADER_SIZE + 1})")
 
+        self.mtu = mtu
+        self.payload_size = payload_size
+
     def fragment_packet(self, packet):
         """
         Split a Reticulum packet into BLE fragments.
@@ -117,13 +135,16 @@ class BLEFragmenter:
 
         # Log fragmentation for multi-fragment packets
         if RNS and num_fragments > 1:
-            RNS.log(f"BLEFragmenter: Fragmenting {packet_size} byte packet into {num_fragments} fragments (MTU={self.mtu}, payload={self.payload_size})", RNS.LOG_DEBUG)
+            if RNS.loglevel >= RNS.LOG_DEBUG:
+                RNS.log(f"BLEFragmenter: Fragmenting {packet_size} byte packet into {num_fragments} fragments (MTU={self.mtu}, payload={self.payload_size})", RNS.LOG_DEBUG)
         elif RNS and num_fragments > 10:
             # Warn about very high fragment counts (possible performance issue)
             RNS.log(f"BLEFragmenter: High fragment count: {num_fragments} fragments for {packet_size} bytes", RNS.LOG_WARNING)
 
         # Always use fragmentation protocol for consistency
         # Even single-fragment packets get headers for uniform handling
+        if num_fragments == 1:
+            return [self.SINGLE_FRAGMENT_HEADER + packet]
 
         fragments = []
 
@@ -155,6 +176,24 @@ class BLEFragmenter:
 
         return fragments
 
+    def fragment_single(self, packet):
+        """
+        Build the fragment of a packet that fits in a single fragment.
+
+        Fast path for the common case: skips the checks and bookkeeping of
+        fragment_packet() and just prepends the constant single-fragment header.
+
+        Args:
+            packet: bytes, the full Reticulum packet
+
+        Returns:
+            bytes, the one BLE fragment, or None if the packet is not non-empty
+            bytes of at most payload_size (use fragment_packet() instead)
+        """
+        if type(packet) is bytes and 0 < len(packet) <= self.payload_size:
+            return self.SINGLE_FRAGMENT_HEADER + packet
+        return None
+
     def get_fragment_overhead(self, packet_size):
         """
         Calculate fragmentation overhead for a given packet size.
@@ -181,17 +220,26 @@ class BLEReassembler:
     incomplete packets.
     """
 
+    __slots__ = ("timeout", "max_pending", "reassembly_buffers",
+                 "packets_reassembled", "packets_timeout", "packets_evicted",
+                 "fragments_received", "_lock")
+
     # Default timeout for incomplete packets (30 seconds)
     DEFAULT_TIMEOUT = 30.0
 
-    def __init__(self, timeout=None):
+    # Default bound on in-progress packets; the oldest is evicted on overflow
+    DEFAULT_MAX_PENDING = 32
+
+    def __init__(self, timeout=None, max_pending=None):
         """
         Initialize reassembler.
 
         Args:
             timeout: Seconds to wait for complete packet before discarding (default 30)
+            max_pending: Maximum incomplete packets buffered at once (default 32)
         """
         self.timeout = timeout if timeout is not None else self.DEFAULT_TIMEOUT
+        self.max_pending = max_pending if max_pending is not None else self.DEFAULT_MAX_PENDING
 
         # Reassembly buffers: {sender_id: buffer_dict}
         # buffer_dict: {'fragments': {seq: data}, 'total': int, 'start_time': float}
@@ -200,8 +248,12 @@ class BLEReassembler:
         # Statistics
         self.packets_reassembled = 0
         self.packets_timeout = 0
+        self.packets_evicted = 0
         self.fragments_received = 0
 
+        # Guards buffers and statistics (see receive_fragment)
+        self._lock = threading.Lock()
+
     def receive_fragment(self, fragment, sender_id=None):
         """
         Process incoming fragment and reassemble if complete.
@@ -223,159 +275,183 @@ class BLEReassembler:
             raise ValueError(f"Fragment too short: {len(fragment)} bytes (min {BLEFragmenter.HEADER_SIZE})")
 
         sender_id = sender_id if sender_id is not None else "default"
-        self.fragments_received += 1
 
-        # Parse header
-        frag_type, sequence, total = struct.unpack("!BHH", fragment[:BLEFragmenter.HEADER_SIZE])
-        data = fragment[BLEFragmenter.HEADER_SIZE:]
-
-        # Validate fragment type
-        if frag_type not in [BLEFragmenter.TYPE_START, BLEFragmenter.TYPE_CONTINUE, BLEFragmenter.TYPE_END]:
-            if RNS:
-                RNS.log(f"BLEReassembler: Invalid fragment type 0x{frag_type:02x} from {sender_id}", RNS.LOG_WARNING)
-            raise ValueError(f"Invalid fragment type: 0x{frag_type:02x}")
-
-        # Validate sequence and total
-        if sequence >= total:
-            if RNS:
-                RNS.log(f"BLEReassembler: Invalid sequence {sequence} >= total {total} from {sender_id}", RNS.LOG_WARNING)
-            raise ValueError(f"Invalid sequence {sequence} >= total {total}")
-
-        if total == 0:
-            if RNS:
-                RNS.log(f"BLEReassembler: Total fragments cannot be zero from {sender_id}", RNS.LOG_WARNING)
-            raise ValueError("Total fragments cannot be zero")
-
-        # Log fragment reception (EXTREME level for high-volume operations)
-        if RNS:
-            frag_type_name = {1: "START", 2: "CONTINUE", 3: "END"}.get(frag_type, "UNKNOWN")
-            RNS.log(f"BLEReassembler: Received {frag_type_name} fragment {sequence+1}/{total} from {sender_id} ({len(data)} bytes)", RNS.LOG_EXTREME)
-
-        # Create unique packet key
-        packet_key = (sender_id, sequence // total, total)  # Approximate packet ID
-
-        # If this is the first fragment (sequence 0), create new buffer
-        if sequence == 0:
-            # Create new reassembly buffer
-            self.reassembly_buffers[packet_key] = {
-                'fragments': {sequence: data},
-                'total': total,  # MEDIUM #7: Store expected total for validation
-                'start_time': time.time(),
-                'sender_id': sender_id
-            }
-        else:
-            # Find existing buffer for this packet
-            buffer_key = None
-            for key, buffer in self.reassembly_buffers.items():
-                if (key[0] == sender_id and
-                    buffer['total'] == total and
-                    time.time() - buffer['start_time'] < self.timeout):
-                    buffer_key = key
-                    break
-
-            if buffer_key is None:
-                # No buffer found - either fragment 0 not received yet or timed out
-                # Create a temporary buffer in case fragment 0 arrives later
-                packet_key = (sender_id, sequence // total, total)
-                if packet_key not in self.reassembly_buffers:
-                    self.reassembly_buffers[packet_key] = {
-                        'fragments': {},
-                        'total': total,
-                        'start_time': time.time(),
-                        'sender_id': sender_id
-                    }
-
-                # CRITICAL #3: Duplicate fragment detection (data corruption prevention)
-                # Check if this fragment was already received with different data
-                if sequence in self.reassembly_buffers[packet_key]['fragments']:
-                    existing_data = self.reassembly_buffers[packet_key]['fragments'][sequence]
-                    if existing_data == data:
-                        # Benign duplicate (retransmit) - ignore
-                        if RNS:
-                            RNS.log(f"BLEReassembler: Duplicate fragment {sequence} from {sender_id} (ignored)",
-                                   RNS.LOG_DEBUG)
-                        return None
-                    else:
-                        # DATA MISMATCH - corruption or protocol error!
-                        if RNS:
-                            RNS.log(f"BLEReassembler: Fragment {sequence} from {sender_id} received twice with "
-                                   f"different data! Possible corruption. Discarding buffer.", RNS.LOG_ERROR)
-                        # Discard the entire buffer as it's corrupted
-                        del self.reassembly_buffers[packet_key]
-                        raise ValueError(
-                            f"Fragment {sequence} from {sender_id} received twice with "
-                            f"different data! Possible corruption."
-                        )
-
-                self.reassembly_buffers[packet_key]['fragments'][sequence] = data
-                return None
+        # Per-instance lock: RX for this peer and the periodic cleanup sweep may
+        # run on different threads, so buffer state is guarded here rather than
+        # by the interface-wide frag_lock
+        with self._lock:
+            self.fragments_received += 1
+
+            # Parse header
+            frag_type, sequence, total = struct.unpack("!BHH", fragment[:BLEFragmenter.HEADER_SIZE])
+            data = fragment[BLEFragmenter.HEADER_SIZE:]
+
+            # Validate fragment type
+            if frag_type not in [BLEFragmenter.TYPE_START, BLEFragmenter.TYPE_CONTINUE, BLEFragmenter.TYPE_END]:
+                if RNS:
+                    RNS.log(f"BLEReassembler: Invalid fragment type 0x{frag_type:02x} from {sender_id}", RNS.LOG_WARNING)
+                raise ValueError(f"Invalid fragment type: 0x{frag_type:02x}")
+
+            # Validate sequence and total
+            if sequence >= total:
+                if RNS:
+                    RNS.log(f"BLEReassembler: Invalid sequence {sequence} >= total {total} from {sender_id}", RNS.LOG_WARNING)
+                raise ValueError(f"Invalid sequence {sequence} >= total {total}")
+
+            if total == 0:
+                if RNS:
+                    RNS.log(f"BLEReassembler: Total fragments cannot be zero from {sender_id}", RNS.LOG_WARNING)
+                raise ValueError("Total fragments cannot be zero")
+
+            # Log fragment reception (EXTREME level for high-volume operations)
+            # Guarded so the f-string is only built when it will actually be logged
+            if RNS and RNS.loglevel >= RNS.LOG_EXTREME:
+                frag_type_name = {1: "START", 2: "CONTINUE", 3: "END"}.get(frag_type, "UNKNOWN")
+                RNS.log(f"BLEReassembler: Received {frag_type_name} fragment {sequence+1}/{total} from {sender_id} ({len(data)} bytes)", RNS.LOG_EXTREME)
+
+            # Create unique packet key. The protocol carries no packet ID and
+            # sequence < total, so this is effectively (sender_id, 0, total):
+            # at most one in-progress packet per sender and fragment count.
+            packet_key = (sender_id, sequence // total, total)  # Approximate packet ID
+
+            # If this is the first fragment (sequence 0), create new buffer
+            if sequence == 0:
+                # Create new reassembly buffer
+                self._evict_if_full(packet_key)
+                self.reassembly_buffers[packet_key] = {
+                    'fragments': {sequence: data},
+                    'total': total,  # MEDIUM #7: Store expected total for validation
+                    'start_time': time.time(),
+                    'sender_id': sender_id
+                }
             else:
-                packet_key = buffer_key
-
-                # MEDIUM #7: Validate fragment total consistency
-                # Ensure all fragments in this packet report the same total count
-                buffer = self.reassembly_buffers[packet_key]
-                if buffer['total'] != total:
-                    if RNS:
-                        RNS.log(f"BLEReassembler: Fragment total mismatch for {sender_id}: "
-                               f"expected {buffer['total']}, got {total}. Discarding buffer.", RNS.LOG_ERROR)
-                    # Discard the entire buffer as it's corrupted
-                    del self.reassembly_buffers[packet_key]
-                    raise ValueError(
-                        f"Fragment total mismatch for {sender_id}: "
-                        f"expected {buffer['total']}, got {total}"
-                    )
-
-                # CRITICAL #3: Duplicate fragment detection (data corruption prevention)
-                # Check if this fragment was already received with different data
-                if sequence in self.reassembly_buffers[packet_key]['fragments']:
-                    existing_data = self.reassembly_buffers[packet_key]['fragments'][sequence]
-                    if existing_data == data:
-                        # Benign duplicate (retransmit) - ignore
-                        if RNS:
-                            RNS.log(f"BLEReassembler: Duplicate fragment {sequence} from {sender_id} (ignored)",
-                                   RNS.LOG_DEBUG)
-                        return None
-                    else:
-                        # DATA MISMATCH - corruption or protocol error!
+                # Find existing buffer for this packet (direct keyed lookup)
+                buffer_key = None
+                buffer = self.reassembly_buffers.get(packet_key)
+                if buffer is not None and time.time() - buffer['start_time'] < self.timeout:
+                    buffer_key = packet_key
+
+                if buffer_key is None:
+                    # No buffer found - either fragment 0 not received yet or timed out
+                    # Create a temporary buffer in case fragment 0 arrives later
+                    packet_key = (sender_id, sequence // total, total)
+                    if packet_key not in self.reassembly_buffers:
+                        self._evict_if_full(packet_key)
+                        self.reassembly_buffers[packet_key] = {
+                            'fragments': {},
+                            'total': total,
+                            'start_time': time.time(),
+                            'sender_id': sender_id
+                        }
+
+                    # CRITICAL #3: Duplicate fragment detection (data corruption prevention)
+                    # Check if this fragment was already received with different data
+                    if sequence in self.reassembly_buffers[packet_key]['fragments']:
+                        existing_data = self.reassembly_buffers[packet_key]['fragments'][sequence]
+                        if existing_data == data:
+                            # Benign duplicate (retransmit) - ignore
+                            if RNS and RNS.loglevel >= RNS.LOG_DEBUG:
+                                RNS.log(f"BLEReassembler: Duplicate fragment {sequence} from {sender_id} (ignored)",
+                                       RNS.LOG_DEBUG)
+                            return None
+                        else:
+                            # DATA MISMATCH - corruption or protocol error!
+                            if RNS:
+                                RNS.log(f"BLEReassembler: Fragment {sequence} from {sender_id} received twice with "
+                                       f"different data! Possible corruption. Discarding buffer.", RNS.LOG_ERROR)
+                            # Discard the entire buffer as it's corrupted
+                            del self.reassembly_buffers[packet_key]
+                            raise ValueError(
+                                f"Fragment {sequence} from {sender_id} received twice with "
+                                f"different data! Possible corruption."
+                            )
+
+                    self.reassembly_buffers[packet_key]['fragments'][sequence] = data
+                    return None
+                else:
+                    packet_key = buffer_key
+
+                    # MEDIUM #7: Validate fragment total consistency
+                    # Ensure all fragments in this packet report the same total count
+                    buffer = self.reassembly_buffers[packet_key]
+                    if buffer['total'] != total:
                         if RNS:
-                            RNS.log(f"BLEReassembler: Fragment {sequence} from {sender_id} received twice with "
-                                   f"different data! Possible corruption. Discarding buffer.", RNS.LOG_ERROR)
+                            RNS.log(f"BLEReassembler: Fragment total mismatch for {sender_id}: "
+                                   f"expected {buffer['total']}, got {total}. Discarding buffer.", RNS.LOG_ERROR)
                         # Discard the entire buffer as it's corrupted
                         del self.reassembly_buffers[packet_key]
                         raise ValueError(
-                            f"Fragment {sequence} from {sender_id} received twice with "
-                            f"different data! Possible corruption."
+                            f"Fragment total mismatch for {sender_id}: "
+                            f"expected {buffer['total']}, got {total}"
                         )
 
-                self.reassembly_buffers[packet_key]['fragments'][sequence] = data
-
-        buffer = self.reassembly_buffers[packet_key]
-
-        # Check if we have all fragments
-        if len(buffer['fragments']) == total:
-            # Check for missing sequences
-            for i in range(total):
-                if i not in buffer['fragments']:
-                    # Missing fragment
-                    return None
-
-            # All fragments received - reassemble
-            packet = self._reassemble(buffer)
-
-            # Clean up buffer
-            del self.reassembly_buffers[packet_key]
+                    # CRITICAL #3: Duplicate fragment detection (data corruption prevention)
+                    # Check if this fragment was already received with different data
+                    if sequence in self.reassembly_buffers[packet_key]['fragments']:
+                        existing_data = self.reassembly_buffers[packet_key]['fragments'][sequence]
+                        if existing_data == data:
+                            # Benign duplicate (retransmit) - ignore
+                            if RNS and RNS.loglevel >= RNS.LOG_DEBUG:
+                                RNS.log(f"BLEReassembler: Duplicate fragment {sequence} from {sender_id} (ignored)",
+                                       RNS.LOG_DEBUG)
+                            return None
+                        else:
+                            # DATA MISMATCH - corruption or protocol error!
+                            if RNS:
+                                RNS.log(f"BLEReassembler: Fragment {sequence} from {sender_id} received twice with "
+                                       f"different data! Possible corruption. Discarding buffer.", RNS.LOG_ERROR)
+                            # Discard the entire buffer as it's corrupted
+                            del self.reassembly_buffers[packet_key]
+                            raise ValueError(
+                                f"Fragment {sequence} from {sender_id} received twice with "
+                                f"different data! Possible corruption."
+                            )
+
+                    self.reassembly_buffers[packet_key]['fragments'][sequence] = data
+
+            buffer = self.reassembly_buffers[packet_key]
+
+            # Check if we have all fragments. Sequences are validated to be
+            # < total and stored once each, so a full count means full coverage.
+            if len(buffer['fragments']) == total:
+                # All fragments received - reassemble
+                packet = self._reassemble(buffer)
+
+                # Clean up buffer
+                del self.reassembly_buffers[packet_key]
+
+                self.packets_reassembled += 1
+
+                # Log successful reassembly
+                if RNS and RNS.loglevel >= RNS.LOG_DEBUG:
+                    RNS.log(f"BLEReassembler: Reassembled {len(packet)} byte packet from {total} fragments (sender: {sender_id})", RNS.LOG_DEBUG)
+
+                return packet
+
+            # Not complete yet
+            return None
+
+    def _evict_if_full(self, packet_key):
+        """
+        Evict the oldest in-progress packet if the buffer limit is reached.
 
-            self.packets_reassembled += 1
+        Called with _lock held before a new buffer is inserted. Buffers are
+        kept in insertion order, so the first entry is the oldest.
 
-            # Log successful reassembly
-            if RNS:
-                RNS.log(f"BLEReassembler: Reassembled {len(packet)} byte packet from {total} fragments (sender: {sender_id})", RNS.LOG_DEBUG)
+        Args:
+            packet_key: Key about to be inserted (not evicted if already present)
+        """
+        if packet_key in self.reassembly_buffers or len(self.reassembly_buffers) < self.max_pending:
+            return
 
-            return packet
+        oldest_key = next(iter(self.reassembly_buffers))
+        oldest = self.reassembly_buffers.pop(oldest_key)
+        self.packets_evicted += 1
 
-        # Not complete yet
-        return None
+        if RNS:
+            RNS.log(f"BLEReassembler: Pending buffer limit ({self.max_pending}) reached, evicted incomplete packet "
+                    f"from {oldest.get('sender_id', 'unknown')} ({len(oldest['fragments'])}/{oldest['total']} fragments)",
+                    RNS.LOG_WARNING)
 
     def _reassemble(self, buffer):
         """
@@ -388,16 +464,12 @@ class BLEReassembler:
             bytes: Complete packet data
         """
         fragments = buffer['fragments']
-        total = buffer['total']
 
         # Combine in sequence order
-        packet_parts = []
-        for i in range(total):
-            if i not in fragments:
-                raise ValueError(f"Missing fragment {i} during reassembly")
-            packet_parts.append(fragments[i])
-
-        return b''.join(packet_parts)
+        try:
+            return b''.join([fragments[i] for i in range(buffer['total'])])
+        except KeyError as e:
+            raise ValueError(f"Missing fragment {e.args[0]} during reassembly") from None
 
     def cleanup_stale_buffers(self):
         """
@@ -409,20 +481,21 @@ class BLEReassembler:
         now = time.time()
         stale_keys = []
 
-        for packet_key, buffer in self.reassembly_buffers.items():
-            if now - buffer['start_time'] > self.timeout:
-                stale_keys.append(packet_key)
+        with self._lock:
+            for packet_key, buffer in self.reassembly_buffers.items():
+                if now - buffer['start_time'] > self.timeout:
+                    stale_keys.append(packet_key)
 
-        for key in stale_keys:
-            buffer = self.reassembly_buffers[key]
-            if RNS:
-                sender = buffer.get('sender_id', 'unknown')
-                received = len(buffer['fragments'])
-                total = buffer['total']
-                RNS.log(f"BLEReassembler: Packet timeout from {sender} ({received}/{total} fragments received, age: {now - buffer['start_time']:.1f}s)", RNS.LOG_WARNING)
+            for key in stale_keys:
+                buffer = self.reassembly_buffers[key]
+                if RNS:
+                    sender = buffer.get('sender_id', 'unknown')
+                    received = len(buffer['fragments'])
+                    total = buffer['total']
+                    RNS.log(f"BLEReassembler: Packet timeout from {sender} ({received}/{total} fragments received, age: {now - buffer['start_time']:.1f}s)", RNS.LOG_WARNING)
 
-            del self.reassembly_buffers[key]
-            self.packets_timeout += 1
+                del self.reassembly_buffers[key]
+                self.packets_timeout += 1
 
         return len(stale_keys)
 
@@ -433,17 +506,38 @@ class BLEReassembler:
         Returns:
             dict: Statistics including packets reassembled, timeouts, etc.
         """
-        return {
-            'packets_reassembled': self.packets_reassembled,
-            'packets_timeout': self.packets_timeout,
-            'fragments_received': self.fragments_received,
-            'pending_packets': len(self.reassembly_buffers)
-        }
+        with self._lock:
+            return {
+                'packets_reassembled': self.packets_reassembled,
+                'packets_timeout': self.packets_timeout,
+                'packets_evicted': self.packets_evicted,
+                'fragments_received': self.fragments_received,
+                'pending_packets': len(self.reassembly_buffers)
+            }
 
     def reset_statistics(self):
         """Reset statistics counters."""
+        with self._lock:
+            self._reset_counters()
+
+    def reset(self):
+        """
+        Drop all pending buffers and statistics so the instance can be reused.
+
+        Returns:
+            int: Number of in-progress buffers dropped
+        """
+        with self._lock:
+            dropped = len(self.reassembly_buffers)
+            self.reassembly_buffers.clear()
+            self._reset_counters()
+        return dropped
+
+    def _reset_counters(self):
+        """Zero statistics counters (caller holds _lock)."""
         self.packets_reassembled = 0
         self.packets_timeout = 0
+        self.packets_evicted = 0
         self.fragments_received = 0
 
 
@@ -39,9 +39,10 @@ import sys
 import os
 import threading
 import time
-import asyncio
+import heapq
 import logging
-from collections import deque
+from operator import itemgetter
+from collections import OrderedDict
 from typing import Optional
 
 # Add interface directory to path for importing other BLE modules
@@ -118,6 +119,50 @@ except ImportError:
 
 HAS_DRIVER = True
 
+# Config string values accepted as boolean true (same set as ConfigObj's as_bool)
+_TRUE_STRS = frozenset(("yes", "true", "1", "on"))
+
+# Driver error severity -> RNS log level (anything else logs at DEBUG)
+_SEVERITY_LEVEL = {
+    "critical": RNS.LOG_CRITICAL,
+    "error": RNS.LOG_ERROR,
+    "warning": RNS.LOG_WARNING,
+}
+
+
+def _mac_to_int(address):
+    """
+    Parse a colon-separated MAC address into an int for direction comparisons.
+
+    Returns:
+        int, or None if the address can't be parsed
+    """
+    try:
+        return int(address.replace(":", ""), 16)
+    except (ValueError, AttributeError):
+        return None
+
+
+def _to_bytes(data):
+    """
+    Coerce received BLE data to bytes with as little copying as possible.
+
+    Bleak delivers bytes or bytearray, bluezero delivers a dbus.Array (a list
+    subclass) of ints. bytes objects are returned as-is, buffer-protocol types
+    are copied once via memcpy, and int sequences go through the C-level
+    bytes() constructor.
+
+    Args:
+        data: Received data (bytes, bytearray, memoryview or list of ints)
+
+    Returns:
+        bytes: The data as an immutable bytes object
+    """
+    if type(data) is bytes:
+        return data
+    return bytes(data)
+
+
 class DiscoveredPeer:
     """
     Tracks information about a discovered BLE peer for connection prioritization.
@@ -139,6 +184,8 @@ class DiscoveredPeer:
        - Recency-based prioritization (prefer active peers)
        - Stale peer cleanup (remove disappeared peers)
        - Connection attempt rate limiting
+       first_seen/last_seen use time.monotonic() since they are only ever
+       compared against each other, never against wall-clock times.
 
     4. Separation of Concerns: We track successful_connections separately
        from failed_connections to enable nuanced scoring (e.g., a peer with
@@ -146,6 +193,12 @@ class DiscoveredPeer:
        from 2 attempts).
     """
 
+    # Up to max_discovered_peers instances live at once and are touched on
+    # every advertisement, so skip the per-instance __dict__
+    __slots__ = ("address", "name", "rssi", "first_seen", "last_seen",
+                 "connection_attempts", "successful_connections", "failed_connections",
+                 "last_connection_attempt", "success_rate", "mac_int")
+
     def __init__(self, address, name, rssi):
         """
         Initialize a discovered peer.
@@ -156,35 +209,44 @@ class DiscoveredPeer:
             rssi: Signal strength in dBm (typically -30 to -100)
         """
         self.address = address
+        self.mac_int = _mac_to_int(address)  # parsed once for MAC-ordered connection direction
         self.name = name
         self.rssi = rssi
-        self.first_seen = time.time()
-        self.last_seen = time.time()
+        self.first_seen = self.last_seen = time.monotonic()
 
         # Connection tracking
         self.connection_attempts = 0
         self.successful_connections = 0
         self.failed_connections = 0
         self.last_connection_attempt = 0
+        self.success_rate = 0.0  # kept in step with the counters, read on every scoring pass
 
     def update_rssi(self, rssi):
         """Update RSSI and last seen timestamp."""
         self.rssi = rssi
-        self.last_seen = time.time()
+        self.last_seen = time.monotonic()
 
     def record_connection_attempt(self):
         """Record that a connection attempt is being made."""
         self.connection_attempts += 1
         self.last_connection_attempt = time.time()
+        self._update_success_rate()
 
     def record_connection_success(self):
         """Record a successful connection."""
         self.successful_connections += 1
+        self._update_success_rate()
 
     def record_connection_failure(self):
         """Record a failed connection."""
         self.failed_connections += 1
 
+    def _update_success_rate(self):
+        if self.connection_attempts:
+            self.success_rate = self.successful_connections / self.connection_attempts
+        else:
+            self.success_rate = 0.0
+
     def get_success_rate(self):
         """
         Get the connection success rate.
@@ -192,9 +254,7 @@ class DiscoveredPeer:
         Returns:
             float: Success rate from 0.0 to 1.0, or 0.0 if no attempts
         """
-        if self.connection_attempts == 0:
-            return 0.0
-        return self.successful_connections / self.connection_attempts
+        return self.success_rate
 
     def __repr__(self):
         return (f"DiscoveredPeer({self.address}, {self.name}, "
@@ -257,6 +317,19 @@ class BLEInterface(Interface):
     POWER_MODE_AGGRESSIVE = "aggressive"  # Continuous scanning
     POWER_MODE_BALANCED = "balanced"  # Intermittent scanning (default)
     POWER_MODE_SAVER = "saver"  # Minimal scanning
+    _VALID_POWER_MODES = frozenset((POWER_MODE_AGGRESSIVE, POWER_MODE_BALANCED, POWER_MODE_SAVER))
+
+    # Number of idle reassemblers kept for reuse across reconnects
+    REASSEMBLER_POOL_SIZE = 8
+
+    # How long a peer selection result is reused across advertisements (seconds)
+    PEER_SELECTION_TTL = 1.0
+
+    # Interval between stale reassembly buffer sweeps (seconds)
+    CLEANUP_INTERVAL = 30.0
+
+    # Minimum interval between sweeps triggered by completed packets (seconds)
+    RX_SWEEP_INTERVAL = 2.0
 
     # Fragmentation constants
     FRAG_TYPE_START = 0x01
@@ -293,6 +366,7 @@ class BLEInterface(Interface):
         self.name = c.get("name", "BLEInterface")
         self.owner = owner
         self.online = False
+        self._inbound = None  # owner.inbound while online, None otherwise
         self.bitrate = BLEInterface.BITRATE_GUESS
         self.mode = Interface.MODE_FULL  # Full mode: enable announce propagation, meshing, transport
 
@@ -315,27 +389,18 @@ class BLEInterface(Interface):
 
         # Power management
         self.power_mode = c.get("power_mode", BLEInterface.POWER_MODE_BALANCED)
-        if self.power_mode not in [BLEInterface.POWER_MODE_AGGRESSIVE,
-                                     BLEInterface.POWER_MODE_BALANCED,
-                                     BLEInterface.POWER_MODE_SAVER]:
+        if self.power_mode not in BLEInterface._VALID_POWER_MODES:
             RNS.log(f"{self} Invalid power mode '{self.power_mode}', using balanced", RNS.LOG_WARNING)
             self.power_mode = BLEInterface.POWER_MODE_BALANCED
+        else:
+            # Config values are fresh strings; intern so later mode compares hit the identity fast path
+            self.power_mode = sys.intern(self.power_mode)
 
         # Central mode (scanning and connecting) configuration
-        enable_central_val = c.get("enable_central", True)
-        # Convert string "yes"/"no" to boolean
-        if isinstance(enable_central_val, str):
-            self.enable_central = enable_central_val.lower() in ["yes", "true", "1"]
-        else:
-            self.enable_central = bool(enable_central_val)
+        self.enable_central = BLEInterface._parse_bool(c, "enable_central", True)
 
         # Peripheral mode (GATT server) configuration
-        enable_peripheral_val = c.get("enable_peripheral", True)
-        # Convert string "yes"/"no" to boolean
-        if isinstance(enable_peripheral_val, str):
-            self.enable_peripheral = enable_peripheral_val.lower() in ["yes", "true", "1"]
-        else:
-            self.enable_peripheral = bool(enable_peripheral_val)
+        self.enable_peripheral = BLEInterface._parse_bool(c, "enable_peripheral", True)
         if self.enable_peripheral and not HAS_GATT_SERVER:
             RNS.log(f"{self} Peripheral mode requested but BLEGATTServer not available", RNS.LOG_WARNING)
             self.enable_peripheral = False
@@ -345,25 +410,28 @@ class BLEInterface(Interface):
         # to physical interfaces. This option enables manual forwarding of local announces to BLE peers.
         # See: Transport.py lines 987-1069 (locally originated announces skip forwarding block)
         # Default: False (disabled, assume Transport behavior is intentional)
-        enable_local_announce_val = c.get("enable_local_announce_forwarding", False)
-        if isinstance(enable_local_announce_val, str):
-            self.enable_local_announce_forwarding = enable_local_announce_val.lower() in ["yes", "true", "1"]
-        else:
-            self.enable_local_announce_forwarding = bool(enable_local_announce_val)
+        self.enable_local_announce_forwarding = BLEInterface._parse_bool(c, "enable_local_announce_forwarding", False)
 
         # State tracking
         self.peers = {}  # address -> (client, last_seen, mtu)
         self.peer_lock = threading.Lock()
 
         # Identity-based interface tracking
-        self.spawned_interfaces = {}  # identity_hash (16 hex chars) -> BLEPeerInterface
+        self.spawned_interfaces = {}  # identity_hash (8 bytes) -> BLEPeerInterface
         self.address_to_identity = {}  # address -> peer_identity (16-byte identity)
         self.identity_to_address = {}  # identity_hash -> address (for reverse lookup)
+        self.address_to_identity_hash = {}  # address -> identity_hash (computed once per identity)
+        self._identity_hash_cache = {}  # 16-byte identity -> identity_hash (see _compute_identity_hash)
+        self._online_peer_ifs = frozenset()  # Online BLEPeerInterfaces (copy-on-write, replaced under peer_lock)
+        self._address_suffix_cache = {}  # address -> short address suffix used in peer names/logs
 
         # Fragmentation
-        self.fragmenters = {}  # address -> BLEFragmenter (per MTU)
-        self.reassemblers = {}  # address -> BLEReassembler
+        self.fragmenters = {}  # frag_key -> BLEFragmenter (copy-on-write, replaced under frag_lock)
+        self.reassemblers = {}  # frag_key -> BLEReassembler (copy-on-write, replaced under frag_lock)
         self.frag_lock = threading.Lock()
+        self._reassembler_pool = []  # Released BLEReassemblers available for reuse
+
+        self._next_rx_sweep = 0.0  # monotonic time of next RX-triggered reassembler sweep
 
         # Discovery state with prioritization
 
@@ -399,13 +467,17 @@ class BLEInterface(Interface):
         # Set driver power mode
         self.driver.set_power_mode(self.power_mode)
 
-        self.discovered_peers = {}  # address -> DiscoveredPeer
+        self.discovered_peers = OrderedDict()  # address -> DiscoveredPeer, least recently seen first
         self.connection_blacklist = {}  # address -> (blacklist_until_timestamp, failure_count)
+        self._blacklist_expiry_heap = []  # (blacklist_until, address) min-heap, see _sweep_blacklist
         self.scanning = False
 
         # HIGH #4: Limit discovered peers to prevent unbounded memory growth
         self.max_discovered_peers = int(c.get("max_discovered_peers", 100))  # Reasonable limit for discovery cache
 
+        # Cached _select_peers_to_connect() result: (monotonic timestamp, frozenset of addresses)
+        self._peer_selection_cache = (float("-inf"), frozenset())
+
         # Connection prioritization configuration
         self.connection_rotation_interval = float(c.get("connection_rotation_interval", 600))  # 10 minutes
         self.connection_retry_backoff = float(c.get("connection_retry_backoff", 60))  # 1 minute
@@ -429,12 +501,34 @@ class BLEInterface(Interface):
         # CRITICAL #2: Periodic cleanup task for stale reassembly buffers
         # This prevents memory leaks from incomplete packet transmissions (disconnects, corrupted data)
         # Runs every 30 seconds to clean up timed-out buffers
-        self.cleanup_timer = None
-        self._start_cleanup_timer()
+        self._stop_event = threading.Event()
+        self._cleanup_thread = None
+
+        # Set once Transport.identity has been handed to the driver
+        self._identity_ready = threading.Event()
+        self._start_cleanup_thread()
 
         # Start the interface
         self.start()
 
+    @staticmethod
+    def _parse_bool(c, key, default):
+        """
+        Read a boolean option, accepting config strings like "yes"/"no".
+
+        Args:
+            c: Configuration object
+            key: Option name
+            default: Value used when the option is absent
+
+        Returns:
+            bool: Parsed option value
+        """
+        value = c.get(key, default)
+        if isinstance(value, str):
+            return value.lower() in _TRUE_STRS
+        return bool(value)
+
     def start(self):
         """Start the BLE interface operations."""
         RNS.log(f"{self} starting BLE operations", RNS.LOG_INFO)
@@ -469,6 +563,7 @@ class BLEInterface(Interface):
         self._clear_stale_ble_paths()
 
         # Set interface online
+        self._inbound = self.owner.inbound if self.owner else None
         self.online = True
         RNS.log(f"{self} interface online", RNS.LOG_INFO)
 
@@ -543,28 +638,32 @@ class BLEInterface(Interface):
         """
         Background thread that waits for Transport.identity, sets it on driver,
         then starts advertising. Times out after 60 seconds if identity doesn't load.
+
+        Transport offers no notification when its identity is loaded, so this polls
+        with exponential backoff (50ms doubling up to 2s): an identity that is ready
+        early is picked up quickly, while a slow start costs only a few wakeups.
+        The wait is on the stop event so detach() ends the thread immediately.
         """
         import RNS.Transport as Transport
 
         attempt = 0
-        start_time = time.time()
+        start_time = time.monotonic()
         timeout = 60.0  # 60 second timeout
 
         RNS.log(f"{self} Waiting for Transport.identity to be loaded...", RNS.LOG_DEBUG)
 
         # Poll until Transport.identity is available (with 60s timeout)
-        while time.time() - start_time < timeout:
-            attempt += 1
-
+        while time.monotonic() - start_time < timeout:
             try:
                 if hasattr(Transport, 'identity') and Transport.identity:
                     identity_hash = Transport.identity.hash
                     if identity_hash and len(identity_hash) == 16:
-                        elapsed = time.time() - start_time
+                        elapsed = time.monotonic() - start_time
                         RNS.log(f"{self} Transport.identity available after {elapsed:.1f}s", RNS.LOG_INFO)
 
                         # Set identity on driver
                         self.driver.set_identity(identity_hash)
+                        self._identity_ready.set()
 
                         # Start advertising
                         try:
@@ -581,7 +680,9 @@ class BLEInterface(Interface):
             except Exception as e:
                 RNS.log(f"{self} Error waiting for identity: {e}", RNS.LOG_DEBUG)
 
-            time.sleep(0.5)
+            if self._stop_event.wait(min(2.0, 0.05 * 2 ** attempt)):
+                return  # Interface detached while waiting
+            attempt += 1
 
         RNS.log(f"{self} Timeout waiting for Transport.identity after {timeout}s", RNS.LOG_ERROR)
 
@@ -609,52 +710,70 @@ class BLEInterface(Interface):
 
             current_time = time.time()
             stale_threshold = 60  # Paths older than 60 seconds are considered stale
-            stale_paths = []
-
-            # Scan for stale BLE paths
-            for dest_hash, entry in list(Transport.path_table.items()):
+            is_ble_type = {}  # interface type -> whether its class name marks it as BLE
+            path_table = Transport.path_table
+            debug = RNS.loglevel >= RNS.LOG_DEBUG
+            cleared = 0
+
+            # Single pass: check and remove each stale BLE path in place. Iterate a
+            # key snapshot, since Transport may update the table concurrently.
+            for dest_hash in list(path_table):
+                entry = path_table.get(dest_hash)
+                if not entry:
+                    continue
                 try:
                     timestamp = entry[0]  # IDX_PT_TIMESTAMP
                     receiving_interface = entry[5]  # IDX_PT_RVCD_IF
+                    if not receiving_interface:
+                        continue
 
-                    # Check if this is a BLE path
-                    if receiving_interface and "BLE" in str(type(receiving_interface).__name__):
-                        # Check for timestamp=0 bug or very old timestamps
-                        if timestamp == 0:
-                            stale_paths.append((dest_hash, timestamp, "timestamp=0 (Unix epoch bug)"))
-                        elif (current_time - timestamp) > stale_threshold:
-                            stale_paths.append((dest_hash, timestamp, f"age={(current_time - timestamp):.0f}s (stale from previous session)"))
+                    # Check if this is a BLE path (class name test done once per type)
+                    interface_type = type(receiving_interface)
+                    is_ble = is_ble_type.get(interface_type)
+                    if is_ble is None:
+                        is_ble = is_ble_type[interface_type] = "BLE" in interface_type.__name__
+
+                    # Check for timestamp=0 bug or very old timestamps
+                    if is_ble and (timestamp == 0 or (current_time - timestamp) > stale_threshold):
+                        path_table.pop(dest_hash, None)
+                        cleared += 1
+                        if debug:
+                            if timestamp == 0:
+                                reason = "timestamp=0 (Unix epoch bug)"
+                            else:
+                                reason = f"age={(current_time - timestamp):.0f}s (stale from previous session)"
+                            RNS.log(f"{self} Cleared stale BLE path for {RNS.prettyhexrep(dest_hash)} - {reason}", RNS.LOG_DEBUG)
                 except (IndexError, TypeError) as e:
                     # Malformed path entry
                     RNS.log(f"{self} Skipping malformed path table entry: {e}", RNS.LOG_DEBUG)
                     continue
 
-            # Remove stale paths
-            if stale_paths:
-                RNS.log(f"{self} Bug #13 workaround: Found {len(stale_paths)} stale BLE path(s) to clear", RNS.LOG_INFO)
-                for dest_hash, old_timestamp, reason in stale_paths:
-                    Transport.path_table.pop(dest_hash)
-                    RNS.log(f"{self} Cleared stale BLE path for {RNS.prettyhexrep(dest_hash)} - {reason}", RNS.LOG_DEBUG)
-                RNS.log(f"{self} Stale path cleanup complete. Fresh paths will be discovered via announces.", RNS.LOG_INFO)
+            if cleared:
+                RNS.log(f"{self} Bug #13 workaround: Cleared {cleared} stale BLE path(s). Fresh paths will be discovered via announces.", RNS.LOG_INFO)
             else:
                 RNS.log(f"{self} No stale BLE paths found in path table", RNS.LOG_DEBUG)
 
         except Exception as e:
             RNS.log(f"{self} Error during stale path cleanup (non-fatal): {e}", RNS.LOG_WARNING)
 
-    def _start_cleanup_timer(self):
+    def _start_cleanup_thread(self):
         """
-        Start the periodic cleanup timer.
+        Start the periodic cleanup thread.
 
-        CRITICAL #2: This timer prevents memory leaks from incomplete reassembly buffers
-        caused by peer disconnections or corrupted partial transmissions.
+        CRITICAL #2: This thread prevents memory leaks from incomplete reassembly buffers
+        caused by peer disconnections or corrupted partial transmissions. A single
+        long-lived thread is used instead of re-arming a threading.Timer every cycle.
         """
-        if self.cleanup_timer:
-            self.cleanup_timer.cancel()
+        self._cleanup_thread = threading.Thread(target=self._cleanup_loop, daemon=True, name="BLE-Cleanup")
+        self._cleanup_thread.start()
 
-        self.cleanup_timer = threading.Timer(30.0, self._periodic_cleanup_task)
-        self.cleanup_timer.daemon = True
-        self.cleanup_timer.start()
+    def _cleanup_loop(self):
+        """Run _periodic_cleanup_task every CLEANUP_INTERVAL until detach() sets the stop event."""
+        while not self._stop_event.wait(BLEInterface.CLEANUP_INTERVAL):
+            try:
+                self._periodic_cleanup_task()
+            except Exception as e:
+                RNS.log(f"{self} periodic cleanup failed: {e}", RNS.LOG_ERROR)
 
     def _periodic_cleanup_task(self):
         """
@@ -666,23 +785,48 @@ class BLEInterface(Interface):
         (especially critical on Pi Zero with only 512MB RAM).
         """
         if not self.online:
-            return  # Don't reschedule if interface is offline
+            return  # Nothing to sweep while the interface is offline
 
-        with self.frag_lock:
-            total_cleaned = 0
-            for peer_address, reassembler in list(self.reassemblers.items()):
-                cleaned = reassembler.cleanup_stale_buffers()
-                if cleaned > 0:
-                    total_cleaned += cleaned
-                    RNS.log(f"{self} cleaned {cleaned} stale reassembly buffer(s) for {peer_address}",
+        total_cleaned = self._sweep_reassemblers()
+        if total_cleaned > 0:
+            RNS.log(f"{self} periodic cleanup: removed {total_cleaned} stale reassembly buffer(s) total",
+                       RNS.LOG_INFO)
+
+    def _sweep_reassemblers(self):
+        """
+        Remove timed-out reassembly buffers from every peer's reassembler.
+
+        Returns:
+            int: Number of buffers removed
+        """
+        # self.reassemblers is copy-on-write, so no lock is needed to iterate it;
+        # each reassembler guards its own buffers
+        total_cleaned = 0
+        for frag_key, reassembler in self.reassemblers.items():
+            cleaned = reassembler.cleanup_stale_buffers()
+            if cleaned > 0:
+                total_cleaned += cleaned
+                if RNS.loglevel >= RNS.LOG_DEBUG:
+                    RNS.log(f"{self} cleaned {cleaned} stale reassembly buffer(s) for {frag_key[:8].hex()}",
                            RNS.LOG_DEBUG)
+        return total_cleaned
 
-            if total_cleaned > 0:
-                RNS.log(f"{self} periodic cleanup: removed {total_cleaned} stale reassembly buffer(s) total",
-                           RNS.LOG_INFO)
+    def _maybe_sweep_reassemblers(self):
+        """
+        Sweep stale reassembly buffers after a completed packet, at most once
+        per RX_SWEEP_INTERVAL.
 
-        # Reschedule for next cleanup cycle
-        self._start_cleanup_timer()
+        Buffers only go stale after the reassembly timeout, so sweeping on every
+        completed packet would mostly scan buffers that are still live.
+        """
+        now = time.monotonic()
+        if now < self._next_rx_sweep:
+            return
+        self._next_rx_sweep = now + BLEInterface.RX_SWEEP_INTERVAL
+        try:
+            self._sweep_reassemblers()
+        except Exception as e:
+            RNS.log(f"{self} error cleaning reassembly buffers: {type(e).__name__}: {e}", RNS.LOG_ERROR)
 
     def _device_discovered_callback(self, device: BLEDevice):
         """
@@ -692,43 +836,52 @@ class BLEInterface(Interface):
         We use peer scoring and connection logic to decide whether to connect.
         """
         # Primary: Match by service UUID (standard BLE discovery)
+        # Called at advertisement rate, so debug messages are only formatted when logged
         if self.service_uuid not in device.service_uuids:
-            RNS.log(f"{self} device {device.name if device.name else device.address} does not advertise Reticulum service UUID, skipping", RNS.LOG_EXTREME)
+            if RNS.loglevel >= RNS.LOG_EXTREME:
+                RNS.log(f"{self} device {device.name if device.name else device.address} does not advertise Reticulum service UUID, skipping", RNS.LOG_EXTREME)
             return
 
         # Validate RSSI - skip devices with invalid/sentinel values
         if device.rssi in (-127, -128, 0):
-            RNS.log(f"{self} skipping {device.name or device.address} ({device.address}): invalid sentinel RSSI {device.rssi} dBm", RNS.LOG_DEBUG)
+            if RNS.loglevel >= RNS.LOG_DEBUG:
+                RNS.log(f"{self} skipping {device.name or device.address} ({device.address}): invalid sentinel RSSI {device.rssi} dBm", RNS.LOG_DEBUG)
             return
 
-        # Update or create discovered peer entry
-        if device.address not in self.discovered_peers:
+        # Update or create discovered peer entry. discovered_peers is kept in
+        # last_seen order, so the least recently seen peer is always first.
+        peer = self.discovered_peers.get(device.address)
+        if peer is None:
             self.discovered_peers[device.address] = DiscoveredPeer(
                 address=device.address,
                 name=device.name,
                 rssi=device.rssi
             )
-        else:
-            self.discovered_peers[device.address].update_rssi(device.rssi)
-
-        # Prune discovery cache if needed (HIGH #4)
-        if len(self.discovered_peers) > self.max_discovered_peers:
-            # Remove oldest entries by last_seen timestamp
-            sorted_peers = sorted(
-                self.discovered_peers.items(),
-                key=lambda x: x[1].last_seen
-            )
-            to_remove = sorted_peers[:-self.max_discovered_peers]
-            for addr, _ in to_remove:
-                del self.discovered_peers[addr]
 
-        # Decide whether to connect based on peer scoring
-        peers_to_connect = self._select_peers_to_connect()
-        if device.address in [p.address for p in peers_to_connect]:
+            # Prune discovery cache if needed (HIGH #4) - evict least recently seen
+            while len(self.discovered_peers) > self.max_discovered_peers:
+                self.discovered_peers.popitem(last=False)
+
+            # A new candidate can change the selection, so don't wait out the TTL
+            self._invalidate_peer_selection()
+        else:
+            peer.update_rssi(device.rssi)
+            self.discovered_peers.move_to_end(device.address)
+
+        # Decide whether to connect based on peer scoring. Scores barely move
+        # between adverts, so the selection is reused for PEER_SELECTION_TTL.
+        now = time.monotonic()
+        selected_at, selected_addresses = self._peer_selection_cache
+        if now - selected_at > BLEInterface.PEER_SELECTION_TTL:
+            selected_addresses = frozenset(p.address for p in self._select_peers_to_connect())
+            self._peer_selection_cache = (now, selected_addresses)
+
+        if device.address in selected_addresses:
             # Record connection attempt BEFORE calling driver.connect()
             # This prevents rapid-fire retries if discovery callback fires again
             if device.address in self.discovered_peers:
                 self.discovered_peers[device.address].record_connection_attempt()
+            self._invalidate_peer_selection()
 
             # Initiate connection via driver
             try:
@@ -757,9 +910,10 @@ class BLEInterface(Interface):
 
                 # Store identity mappings
                 self.address_to_identity[address] = peer_identity
+                self.address_to_identity_hash[address] = identity_hash
                 self.identity_to_address[identity_hash] = address
 
-                RNS.log(f"{self} connected to {address} as CENTRAL, received identity: {identity_hash}", RNS.LOG_INFO)
+                RNS.log(f"{self} connected to {address} as CENTRAL, received identity: {identity_hash.hex()}", RNS.LOG_INFO)
                 self._record_connection_success(address)
             else:
                 RNS.log(f"{self} invalid identity from {address} (wrong length), disconnecting", RNS.LOG_WARNING)
@@ -799,7 +953,7 @@ class BLEInterface(Interface):
         if existing_address and existing_address != address:
             # Same identity, different MAC - this is Android MAC rotation
             RNS.log(
-                f"{self} duplicate identity detected: {identity_hash[:8]} already connected via {existing_address}, "
+                f"{self} duplicate identity detected: {identity_hash[:4].hex()} already connected via {existing_address}, "
                 f"rejecting connection from {address} (Android MAC rotation)",
                 RNS.LOG_WARNING
             )
@@ -826,29 +980,28 @@ class BLEInterface(Interface):
         frag_key = self._get_fragmenter_key(peer_identity, address)
 
         with self.frag_lock:
-            # Create fragmenter with MTU
-            self.fragmenters[frag_key] = BLEFragmenter(mtu=mtu)
+            # Create fragmenter with MTU, or update it in place on renegotiation
+            self._ensure_fragmenter(frag_key, mtu)
 
             # Create reassembler if not exists
             if frag_key not in self.reassemblers:
-                self.reassemblers[frag_key] = BLEReassembler()
+                self._put_reassembler(frag_key, self._create_reassembler())
 
         # Spawn peer interface if not exists
-        identity_hash = self._compute_identity_hash(peer_identity)
+        identity_hash = self._get_identity_hash(address, peer_identity)
         if identity_hash not in self.spawned_interfaces:
             # Get peer name from discovered peers
-            peer_name = None
-            if address in self.discovered_peers:
-                peer_name = self.discovered_peers[address].name
-            else:
-                peer_name = f"BLE-{address[-8:]}"
+            peer = self.discovered_peers.get(address)
+            peer_name = peer.name if peer is not None else f"BLE-{self._suffix(address)}"
 
-            # Determine connection type based on MAC sorting
+            # Determine connection type based on MAC sorting (numeric compare,
+            # reusing the MAC already parsed at discovery when available)
             connection_type = "central"
-            if self.driver.get_local_address():
-                local_mac = self.driver.get_local_address().lower()
-                peer_mac = address.lower()
-                if local_mac > peer_mac:
+            local_mac = self.driver.get_local_address()
+            if local_mac:
+                local_mac_int = self._local_mac_int if local_mac == self._local_address else _mac_to_int(local_mac)
+                peer_mac_int = peer.mac_int if peer is not None else _mac_to_int(address)
+                if local_mac_int is not None and peer_mac_int is not None and local_mac_int > peer_mac_int:
                     connection_type = "peripheral"
 
             self._spawn_peer_interface(
@@ -885,13 +1038,14 @@ class BLEInterface(Interface):
 
         try:
             # Store central's identity
-            central_identity = bytes(data)
+            central_identity = _to_bytes(data)
             identity_hash = self._compute_identity_hash(central_identity)
 
             self.address_to_identity[address] = central_identity
+            self.address_to_identity_hash[address] = identity_hash
             self.identity_to_address[identity_hash] = address
 
-            RNS.log(f"{self} received identity handshake from {address}: {identity_hash}", RNS.LOG_INFO)
+            RNS.log(f"{self} received identity handshake from {address}: {identity_hash.hex()}", RNS.LOG_INFO)
 
             # Get MTU for this connection (should be negotiated by now)
             mtu = self.driver.get_peer_mtu(address)
@@ -902,13 +1056,13 @@ class BLEInterface(Interface):
             frag_key = self._get_fragmenter_key(central_identity, address)
 
             with self.frag_lock:
-                self.fragmenters[frag_key] = BLEFragmenter(mtu=mtu)
+                self._ensure_fragmenter(frag_key, mtu)
                 if frag_key not in self.reassemblers:
-                    self.reassemblers[frag_key] = BLEReassembler()
+                    self._put_reassembler(frag_key, self._create_reassembler())
 
             # Spawn peer interface if not already spawned
             if identity_hash not in self.spawned_interfaces:
-                peer_name = f"Central-{address[-8:]}"
+                peer_name = f"Central-{self._suffix(address)}"
                 connection_type = "peripheral"  # We're the peripheral
 
                 self._spawn_peer_interface(
@@ -947,38 +1101,40 @@ class BLEInterface(Interface):
         Cleans up peer state, interfaces, and fragmentation buffers.
         """
         RNS.log(f"{self} disconnected from {address}", RNS.LOG_INFO)
+        self._invalidate_peer_selection()
 
         # Clean up peer connection state
         with self.peer_lock:
-            if address in self.peers:
-                del self.peers[address]
+            self.peers.pop(address, None)
 
         # Detach interface
         peer_identity = self.address_to_identity.get(address)
         if peer_identity:
-            identity_hash = self._compute_identity_hash(peer_identity)
-            if identity_hash in self.spawned_interfaces:
-                peer_if = self.spawned_interfaces[identity_hash]
+            identity_hash = self._get_identity_hash(address, peer_identity)
+            peer_if = self.spawned_interfaces.pop(identity_hash, None)
+            if peer_if is not None:
+                with self.peer_lock:
+                    self._online_peer_ifs = self._online_peer_ifs - {peer_if}
                 peer_if.detach()
-                del self.spawned_interfaces[identity_hash]
                 RNS.log(f"{self} detached interface for {address}", RNS.LOG_DEBUG)
 
             # Clean up identity mappings to prevent stale connections
-            if address in self.address_to_identity:
-                del self.address_to_identity[address]
+            if self.address_to_identity.pop(address, None) is not None:
                 RNS.log(f"{self} cleaned up address_to_identity for {address}", RNS.LOG_DEBUG)
-            if identity_hash in self.identity_to_address:
-                del self.identity_to_address[identity_hash]
-                RNS.log(f"{self} cleaned up identity_to_address for {identity_hash}", RNS.LOG_DEBUG)
+            self.address_to_identity_hash.pop(address, None)
+            self._identity_hash_cache.pop(peer_identity, None)
+            self._address_suffix_cache.pop(address, None)
+            if self.identity_to_address.pop(identity_hash, None) is not None:
+                RNS.log(f"{self} cleaned up identity_to_address for {identity_hash.hex()}", RNS.LOG_DEBUG)
 
         # Clean up fragmenter/reassembler
         if peer_identity:
             frag_key = self._get_fragmenter_key(peer_identity, address)
             with self.frag_lock:
-                if frag_key in self.fragmenters:
-                    del self.fragmenters[frag_key]
-                if frag_key in self.reassemblers:
-                    del self.reassemblers[frag_key]
+                self._pop_fragmenter(frag_key)
+                reassembler = self._pop_reassembler(frag_key)
+            if reassembler is not None:
+                self._release_reassembler(reassembler)
 
     def _error_callback(self, severity: str, message: str, exc: Exception = None):
         """
@@ -1007,23 +1163,19 @@ class BLEInterface(Interface):
             else:
                 log_level = RNS.LOG_ERROR
                 should_blacklist = True
-        elif severity == "critical":
-            log_level = RNS.LOG_CRITICAL
-        elif severity == "error":
-            log_level = RNS.LOG_ERROR
-            should_blacklist = True
-        elif severity == "warning":
-            log_level = RNS.LOG_WARNING
-            # Connection timeouts should also trigger blacklist
-            if "Connection timeout" in message:
-                should_blacklist = True
         else:
-            log_level = RNS.LOG_DEBUG
+            log_level = _SEVERITY_LEVEL.get(severity, RNS.LOG_DEBUG)
+            if severity == "error":
+                should_blacklist = True
+            elif severity == "warning" and "Connection timeout" in message:
+                # Connection timeouts should also trigger blacklist
+                should_blacklist = True
 
-        if exc:
-            RNS.log(f"{self} driver {severity}: {message} - {type(exc).__name__}: {exc}", log_level)
-        else:
-            RNS.log(f"{self} driver {severity}: {message}", log_level)
+        if RNS.loglevel >= log_level:
+            if exc:
+                RNS.log(f"{self} driver {severity}: {message} - {type(exc).__name__}: {exc}", log_level)
+            else:
+                RNS.log(f"{self} driver {severity}: {message}", log_level)
 
         # Extract address from connection failure messages and trigger blacklist
         if should_blacklist:
@@ -1035,7 +1187,7 @@ class BLEInterface(Interface):
                 RNS.log(f"{self} recording connection failure for {address} to activate blacklist", RNS.LOG_INFO)
                 self._record_connection_failure(address)
 
-    def _score_peer(self, peer):
+    def _score_peer(self, peer, now=None):
         """
         Calculate priority score for peer selection.
 
@@ -1075,6 +1227,8 @@ class BLEInterface(Interface):
 
         Args:
             peer: DiscoveredPeer object
+            now: time.monotonic() value to measure recency against; callers
+                 scoring many peers pass one value for the whole pass
 
         Returns:
             float: Priority score (higher = better), typically 0-145
@@ -1082,42 +1236,32 @@ class BLEInterface(Interface):
                   - New peer: 70 (RSSI) + 25 (new bonus) + 25 (recent) = 120
                   - Poor peer: 0 (RSSI) + 0 (history) + 0 (old) = 0
         """
-        score = 0.0
-
         # Validate RSSI - reject peers with invalid/sentinel values
         if peer.rssi is None or peer.rssi in (-127, -128, 0):
-            RNS.log(f"{self} peer {peer.address} has invalid RSSI {peer.rssi}, returning minimum score", RNS.LOG_DEBUG)
+            if RNS.loglevel >= RNS.LOG_DEBUG:
+                RNS.log(f"{self} peer {peer.address} has invalid RSSI {peer.rssi}, returning minimum score", RNS.LOG_DEBUG)
             return 0.0
 
-        # Signal strength component (0-100 points)
+        # Signal strength component (0-70 points)
         # RSSI typically ranges from -30 (excellent) to -100 (poor)
-        # Convert to 0-100 scale
-        if peer.rssi is not None:
-            # Clamp RSSI to reasonable range
-            rssi_clamped = max(-100, min(-30, peer.rssi))
-            # Convert to 0-70 range (-100 → 0, -30 → 70)
-            rssi_normalized = (rssi_clamped + 100) * (70.0 / 70.0)
-            score += rssi_normalized
+        # Clamp to that range and convert to 0-70 (-100 → 0, -30 → 70)
+        score = min(max(peer.rssi, -100), -30) + 100.0
 
         # Connection history component (0-50 points)
         # Reward peers with good connection history
         if peer.connection_attempts > 0:
-            success_rate = peer.get_success_rate()
-            score += success_rate * 50.0
+            score += peer.success_rate * 50.0
         else:
             # New peers get a moderate score (benefit of the doubt)
             score += 25.0
 
         # Recency component (0-25 points)
         # Prefer recently seen peers
-        age_seconds = time.time() - peer.last_seen
-        if age_seconds < 5.0:
-            # Very recent (< 5 seconds) - full points
-            score += 25.0
-        elif age_seconds < 30.0:
-            # Recent (< 30 seconds) - decay linearly
-            score += 25.0 * (1.0 - (age_seconds - 5.0) / 25.0)
-        # Older peers get 0 recency points
+        if now is None:
+            now = time.monotonic()
+        # Full points under 5 seconds, then linear decay to 0 at 30 seconds:
+        # 25 * (1 - (age - 5) / 25) simplifies to 30 - age, clamped to [0, 25]
+        score += max(0.0, min(25.0, 30.0 - (now - peer.last_seen)))
 
         return score
 
@@ -1145,7 +1289,8 @@ class BLEInterface(Interface):
            entirely. This prevents connection churn from repeatedly attempting
            to connect to consistently failing peers.
 
-        4. Sort by Score: Sorting ensures deterministic selection and allows
+        4. Rank by Score: Top-K selection (heapq.nlargest, same ordering as a
+           stable descending sort) ensures deterministic selection and allows
            for easy debugging (highest-scored peers are always chosen first).
 
         5. Slot-Based Limits: We calculate available_slots = max_peers - current
@@ -1160,85 +1305,124 @@ class BLEInterface(Interface):
         if available_slots <= 0:
             return []
 
-        # Score all discovered peers
+        self._sweep_blacklist()
+
+        # Score all discovered peers. Per-tick state is hoisted into locals so
+        # the loop body does no repeated attribute lookups.
         scored_peers = []
+        debug = RNS.loglevel >= RNS.LOG_DEBUG
+        local_mac_int = self._local_mac_int
+        now = time.monotonic()
+        wall_now = time.time()
+        peers = self.peers
+        spawned = self.spawned_interfaces
+        address_to_identity = self.address_to_identity
+        blacklist = self.connection_blacklist
+
+        # Snapshot in-progress connections once per tick rather than per candidate
+        connecting = ()
+        if hasattr(self.driver, '_connecting_peers'):
+            with self.driver._connecting_lock:
+                connecting = set(self.driver._connecting_peers)
+
         for address, peer in self.discovered_peers.items():
             # Skip if already connected
-            if address in self.peers:
+            if address in peers:
                 continue
 
             # Skip if connection is already in progress
-            if hasattr(self.driver, '_connecting_peers'):
-                with self.driver._connecting_lock:
-                    if address in self.driver._connecting_peers:
-                        # Diagnostic: Show ALL addresses currently being connected to
-                        all_connecting = list(self.driver._connecting_peers)
-                        RNS.log(f"{self} [v2.2] skipping {peer.name} ({address}) - connection already in progress",
-                                RNS.LOG_DEBUG)
-                        RNS.log(f"{self} [DIAGNOSTIC] Currently connecting to {len(all_connecting)} address(es): {all_connecting}",
-                                RNS.LOG_INFO)
-                        continue
+            if address in connecting:
+                if debug:
+                    RNS.log(f"{self} [v2.2] skipping {peer.name} ({address}) - connection already in progress",
+                            RNS.LOG_DEBUG)
+                # Diagnostic: Show ALL addresses currently being connected to
+                RNS.log(f"{self} [DIAGNOSTIC] Currently connecting to {len(connecting)} address(es): {list(connecting)}",
+                        RNS.LOG_INFO)
+                continue
 
             # Rate limiting: Skip if we recently attempted connection to this peer
-            time_since_attempt = time.time() - peer.last_connection_attempt
+            time_since_attempt = wall_now - peer.last_connection_attempt
             if peer.last_connection_attempt > 0 and time_since_attempt < 5.0:
-                RNS.log(f"{self} [v2.2] skipping {peer.name} - connection attempted {time_since_attempt:.1f}s ago (rate limit: 5s)",
-                        RNS.LOG_DEBUG)
+                if debug:
+                    RNS.log(f"{self} [v2.2] skipping {peer.name} - connection attempted {time_since_attempt:.1f}s ago (rate limit: 5s)",
+                            RNS.LOG_DEBUG)
                 continue
 
             # Protocol v2.2: Skip if interface exists for this identity (any connection type)
             # This prevents dual connections (central + peripheral to same peer)
-            peer_identity = self.address_to_identity.get(address)
+            peer_identity = address_to_identity.get(address)
             if peer_identity:
-                identity_hash = self._compute_identity_hash(peer_identity)
-                if identity_hash in self.spawned_interfaces:
-                    RNS.log(f"{self} [v2.2] skipping {peer.name} - interface exists for identity {identity_hash[:8]}",
-                            RNS.LOG_DEBUG)
+                identity_hash = self._get_identity_hash(address, peer_identity)
+                if identity_hash in spawned:
+                    if debug:
+                        RNS.log(f"{self} [v2.2] skipping {peer.name} - interface exists for identity {identity_hash[:4].hex()}",
+                                RNS.LOG_DEBUG)
                     continue
 
             # Protocol v2.2: MAC address sorting - deterministic connection direction
             # Lower MAC initiates (central), higher MAC only accepts (peripheral)
-            # This prevents simultaneous connection attempts from both sides
-            if self.local_address is not None:
-                try:
-                    # Normalize addresses (remove colons)
-                    my_mac = self.local_address.replace(":", "")
-                    peer_mac = address.replace(":", "")
-
-                    my_mac_int = int(my_mac, 16)
-                    peer_mac_int = int(peer_mac, 16)
-
-                    if my_mac_int > peer_mac_int:
-                        # Our MAC is higher - let them connect to us (we stay peripheral only)
-                        RNS.log(f"{self} [v2.2] skipping {peer.name} (MAC {address[:17]}) - "
-                                f"connection direction: they initiate (lower MAC connects to higher)",
-                                RNS.LOG_DEBUG)
-                        continue
-                except (ValueError, AttributeError) as e:
-                    # MAC parsing failed - fall through to normal connection logic
-                    RNS.log(f"{self} MAC sorting failed for {peer.name}: {e}", RNS.LOG_DEBUG)
+            # This prevents simultaneous connection attempts from both sides.
+            # Both MACs are parsed once (local_address setter, DiscoveredPeer);
+            # if either failed to parse, fall through to normal connection logic.
+            if local_mac_int is not None and peer.mac_int is not None and local_mac_int > peer.mac_int:
+                # Our MAC is higher - let them connect to us (we stay peripheral only)
+                if debug:
+                    RNS.log(f"{self} [v2.2] skipping {peer.name} (MAC {address[:17]}) - "
+                            f"connection direction: they initiate (lower MAC connects to higher)",
+                            RNS.LOG_DEBUG)
+                continue
 
-            # Skip if blacklisted
-            if self._is_blacklisted(address):
+            # Skip if blacklisted (same expiry check as _is_blacklisted)
+            entry = blacklist.get(address)
+            if entry is not None and wall_now < entry[0]:
                 continue
 
             # Calculate score
-            score = self._score_peer(peer)
+            score = self._score_peer(peer, now)
             scored_peers.append((score, peer))
 
-        # Sort by score (highest first)
-        scored_peers.sort(reverse=True, key=lambda x: x[0])
-
-        # Select top N peers
-        selected = [peer for score, peer in scored_peers[:available_slots]]
+        # Select top N peers by score (highest first). available_slots is
+        # bounded by max_peers, so a heap top-K beats sorting every candidate.
+        top_scored = heapq.nlargest(available_slots, scored_peers, key=itemgetter(0))
+        selected = [peer for score, peer in top_scored]
 
-        if selected:
+        if selected and debug:
             RNS.log(f"{self} selected {len(selected)} peers to connect from {len(scored_peers)} candidates", RNS.LOG_DEBUG)
-            for score, peer in scored_peers[:available_slots]:
-                RNS.log(f"{self}   -> {peer.name} (score: {score:.1f}, RSSI: {peer.rssi})", RNS.LOG_EXTREME)
+            if RNS.loglevel >= RNS.LOG_EXTREME:
+                for score, peer in top_scored:
+                    RNS.log(f"{self}   -> {peer.name} (score: {score:.1f}, RSSI: {peer.rssi})", RNS.LOG_EXTREME)
 
         return selected
 
+    def _sweep_blacklist(self):
+        """
+        Purge expired blacklist entries.
+
+        Expiry times recorded by _record_connection_failure are kept in a
+        min-heap alongside connection_blacklist, so only entries that have
+        actually expired are touched and a sweep with nothing due is a single
+        comparison. Heap entries left behind by re-blacklisting or a successful
+        connection no longer match the dict and are discarded when they surface.
+        This is bulk cleanup only: _is_blacklisted() still checks each entry's
+        expiry itself, so entries written any other way expire correctly too.
+        """
+        heap = self._blacklist_expiry_heap
+        if not heap:
+            return
+
+        # Entries hold wall-clock expiry times (see _record_connection_failure)
+        now = time.time()
+        expired = 0
+        while heap and heap[0][0] <= now:
+            blacklist_until, address = heapq.heappop(heap)
+            entry = self.connection_blacklist.get(address)
+            if entry is not None and entry[0] == blacklist_until:
+                del self.connection_blacklist[address]
+                expired += 1
+
+        if expired and RNS.loglevel >= RNS.LOG_DEBUG:
+            RNS.log(f"{self} purged {expired} expired blacklist entr{'y' if expired == 1 else 'ies'}", RNS.LOG_DEBUG)
+
     def _is_blacklisted(self, address):
         """
         Check if a peer is temporarily blacklisted.
@@ -1249,10 +1433,11 @@ class BLEInterface(Interface):
         Returns:
             bool: True if peer is blacklisted
         """
-        if address not in self.connection_blacklist:
+        entry = self.connection_blacklist.get(address)
+        if entry is None:
             return False
 
-        blacklist_until, failure_count = self.connection_blacklist[address]
+        blacklist_until, failure_count = entry
 
         # Check if blacklist has expired
         if time.time() >= blacklist_until:
@@ -1263,6 +1448,16 @@ class BLEInterface(Interface):
 
         return True
 
+    def _invalidate_peer_selection(self):
+        """
+        Drop the cached peer selection so the next advertisement re-scores.
+
+        Called whenever state changes in a way that affects
+        _select_peers_to_connect() (new peers, attempts, results, spawns,
+        disconnects).
+        """
+        self._peer_selection_cache = (float("-inf"), frozenset())
+
     def _record_connection_success(self, address):
         """
         Record a successful connection.
@@ -1270,12 +1465,12 @@ class BLEInterface(Interface):
         Args:
             address: BLE address of peer
         """
+        self._invalidate_peer_selection()
         if address in self.discovered_peers:
             self.discovered_peers[address].record_connection_success()
 
             # Clear blacklist on success
-            if address in self.connection_blacklist:
-                del self.connection_blacklist[address]
+            if self.connection_blacklist.pop(address, None) is not None:
                 RNS.log(f"{self} cleared blacklist for {address} after successful connection", RNS.LOG_DEBUG)
 
     def _record_connection_failure(self, address):
@@ -1305,6 +1500,7 @@ class BLEInterface(Interface):
         Args:
             address: BLE address of peer
         """
+        self._invalidate_peer_selection()
         if address in self.discovered_peers:
             peer = self.discovered_peers[address]
             peer.record_connection_failure()
@@ -1317,6 +1513,7 @@ class BLEInterface(Interface):
                 blacklist_until = time.time() + blacklist_duration
 
                 self.connection_blacklist[address] = (blacklist_until, peer.failed_connections)
+                heapq.heappush(self._blacklist_expiry_heap, (blacklist_until, address))
                 RNS.log(f"{self} blacklisted {peer.name} for {blacklist_duration:.0f}s after {peer.failed_connections} failures", RNS.LOG_WARNING)
 
                 # Clean up BlueZ device state after blacklisting to prevent persistent errors
@@ -1338,28 +1535,174 @@ class BLEInterface(Interface):
 
     def _get_fragmenter_key(self, peer_identity, peer_address):
         """
-        Compute fragmenter/reassembler dictionary key using full identity hash.
+        Compute fragmenter/reassembler dictionary key using the full identity.
+
+        The raw identity bytes are used as the key: this runs for every inbound
+        fragment, and bytes cache their hash, so no per-call encoding is needed.
+        Use .hex() when formatting the key for logs.
 
         Args:
             peer_identity: 16-byte peer identity
             peer_address: BLE MAC address (unused, kept for compatibility)
 
         Returns:
-            str: Full 16-byte identity as 32 hex characters
+            bytes: Full 16-byte identity
         """
-        return peer_identity.hex()
+        return bytes(peer_identity)
 
     def _compute_identity_hash(self, peer_identity):
         """
-        Compute 16-character hex identity hash for interface tracking.
+        Compute the identity hash used as the interface tracking key.
+
+        The key is the first 8 bytes of the identity's full hash, kept as raw
+        bytes: no hex encoding on the hot path, and bytes cache their hash. Use
+        .hex() when formatting it for logs.
 
         Args:
             peer_identity: 16-byte peer identity
 
         Returns:
-            str: Identity hash (16 hex chars)
+            bytes: Identity hash (8 bytes)
         """
-        return RNS.Identity.full_hash(peer_identity)[:16].hex()[:16]
+        # Memoized per identity: the SHA-256 runs once per peer, not on every
+        # connect/handshake/duplicate check. Entries are dropped on disconnect.
+        identity_hash = self._identity_hash_cache.get(peer_identity)
+        if identity_hash is None:
+            identity_hash = RNS.Identity.full_hash(peer_identity)[:8]
+            self._identity_hash_cache[bytes(peer_identity)] = identity_hash
+        return identity_hash
+
+    def _create_fragmenter(self, mtu):
+        """
+        Create a fragmenter for a newly connected peer.
+
+        Existing fragmenters are updated in place with set_mtu() on MTU
+        renegotiation instead of being replaced.
+
+        Args:
+            mtu: Negotiated MTU for the connection
+
+        Returns:
+            BLEFragmenter: New fragmenter
+        """
+        return BLEFragmenter(mtu=mtu)
+
+    def _ensure_fragmenter(self, frag_key, mtu):
+        """
+        Create the fragmenter for frag_key, or update the existing one's MTU.
+
+        self.fragmenters is copy-on-write like self.reassemblers: senders read
+        it without taking frag_lock, so a new fragmenter is published in a new
+        dict. Caller must hold frag_lock.
+        """
+        fragmenter = self.fragmenters.get(frag_key)
+        if fragmenter is not None:
+            fragmenter.set_mtu(mtu)
+            return
+        fragmenters = dict(self.fragmenters)
+        fragmenters[frag_key] = self._create_fragmenter(mtu)
+        self.fragmenters = fragmenters
+
+    def _pop_fragmenter(self, frag_key):
+        """Remove and return the fragmenter for frag_key (caller must hold frag_lock)."""
+        if frag_key not in self.fragmenters:
+            return None
+        fragmenters = dict(self.fragmenters)
+        fragmenter = fragmenters.pop(frag_key)
+        self.fragmenters = fragmenters
+        return fragmenter
+
+    def _create_reassembler(self, timeout=None):
+        """
+        Get a reassembler for a newly connected peer, reusing a pooled one if available.
+
+        Args:
+            timeout: Reassembly timeout in seconds (None uses BLEReassembler default)
+
+        Returns:
+            BLEReassembler: Empty reassembler
+        """
+        try:
+            reassembler = self._reassembler_pool.pop()
+        except IndexError:
+            return BLEReassembler(timeout=timeout)
+
+        reassembler.timeout = timeout if timeout is not None else BLEReassembler.DEFAULT_TIMEOUT
+        return reassembler
+
+    def _release_reassembler(self, reassembler):
+        """
+        Return a disconnected peer's reassembler to the pool for reuse.
+
+        Args:
+            reassembler: BLEReassembler no longer referenced by any peer
+
+        Returns:
+            int: Number of pending reassembly buffers dropped
+        """
+        freed = reassembler.reset()
+        if len(self._reassembler_pool) < self.REASSEMBLER_POOL_SIZE:
+            self._reassembler_pool.append(reassembler)
+        return freed
+
+    def _put_reassembler(self, frag_key, reassembler):
+        """
+        Install a reassembler for frag_key, returning the one it replaces.
+
+        self.reassemblers is copy-on-write: the RX paths read it without taking
+        frag_lock, so writers publish a new dict instead of mutating it.
+        Caller must hold frag_lock.
+        """
+        reassemblers = dict(self.reassemblers)
+        old = reassemblers.get(frag_key)
+        reassemblers[frag_key] = reassembler
+        self.reassemblers = reassemblers
+        return old
+
+    def _pop_reassembler(self, frag_key):
+        """Remove and return the reassembler for frag_key (caller must hold frag_lock)."""
+        if frag_key not in self.reassemblers:
+            return None
+        reassemblers = dict(self.reassemblers)
+        reassembler = reassemblers.pop(frag_key)
+        self.reassemblers = reassemblers
+        return reassembler
+
+    def _suffix(self, address):
+        """
+        Get the short address suffix (last 8 chars) used in peer names and logs.
+
+        Args:
+            address: BLE MAC address
+
+        Returns:
+            str: Cached address suffix
+        """
+        suffix = self._address_suffix_cache.get(address)
+        if suffix is None:
+            suffix = self._address_suffix_cache[address] = address[-8:]
+        return suffix
+
+    def _get_identity_hash(self, address, peer_identity):
+        """
+        Look up the cached identity hash for a peer address.
+
+        The hash is stored when the identity is learned (connect or handshake),
+        so hot paths avoid re-hashing the identity on every fragment. Falls back
+        to computing (and caching) it if the address has no cached entry.
+
+        Args:
+            address: BLE MAC address of the peer
+            peer_identity: 16-byte peer identity
+
+        Returns:
+            bytes: Identity hash (8 bytes)
+        """
+        identity_hash = self.address_to_identity_hash.get(address)
+        if identity_hash is None:
+            identity_hash = self._compute_identity_hash(peer_identity)
+            self.address_to_identity_hash[address] = identity_hash
+        return identity_hash
 
     def _spawn_peer_interface(self, address, name, peer_identity, client=None, mtu=None, connection_type="central"):
         """
@@ -1377,11 +1720,11 @@ class BLEInterface(Interface):
             BLEPeerInterface: The spawned interface
         """
         # Compute lookup key using identity hash
-        identity_hash = self._compute_identity_hash(peer_identity)
+        identity_hash = self._get_identity_hash(address, peer_identity)
 
         # Check if interface already exists (MAC sorting should prevent this)
         if identity_hash in self.spawned_interfaces:
-            RNS.log(f"{self} interface already exists for {name} ({identity_hash[:8]}), reusing", RNS.LOG_WARNING)
+            RNS.log(f"{self} interface already exists for {name} ({identity_hash[:4].hex()}), reusing", RNS.LOG_WARNING)
             return self.spawned_interfaces[identity_hash]
 
         # Create new peer interface
@@ -1393,13 +1736,17 @@ class BLEInterface(Interface):
         peer_if.HW_MTU = self.HW_MTU
         peer_if.online = True
 
-        # Register with transport
+        # Register with transport (remember the slot so detach can skip the list scan)
+        peer_if._transport_index = len(RNS.Transport.interfaces)
         RNS.Transport.interfaces.append(peer_if)
 
         # Store in tracking dict
         self.spawned_interfaces[identity_hash] = peer_if
+        with self.peer_lock:
+            self._online_peer_ifs = self._online_peer_ifs | {peer_if}
+        self._invalidate_peer_selection()
 
-        RNS.log(f"{self} created peer interface for {name} ({identity_hash[:8]}), type={connection_type}", RNS.LOG_INFO)
+        RNS.log(f"{self} created peer interface for {name} ({identity_hash[:4].hex()}), type={connection_type}", RNS.LOG_INFO)
 
         return peer_if
 
@@ -1411,12 +1758,16 @@ class BLEInterface(Interface):
             peer_address: Address of peer that sent data
             data: Raw bytes received (might be fragment)
         """
-        RNS.log(f"{self} received {len(data)} bytes from peer {peer_address}", RNS.LOG_EXTREME)
+        # Per-fragment logging is guarded so the f-strings are only built when logged
+        extreme = RNS.loglevel >= RNS.LOG_EXTREME
+        if extreme:
+            RNS.log(f"{self} received {len(data)} bytes from peer {peer_address}", RNS.LOG_EXTREME)
 
         # Filter 1-byte keep-alive packets from Columba (Android) peers
         # Columba sends 0x00 every 15 seconds to prevent Android BLE supervision timeout
         if len(data) == 1 and data[0] == 0x00:
-            RNS.log(f"{self} received keep-alive from peer {peer_address}, ignoring", RNS.LOG_EXTREME)
+            if extreme:
+                RNS.log(f"{self} received keep-alive from peer {peer_address}, ignoring", RNS.LOG_EXTREME)
             return
 
         # Look up peer identity to compute fragmenter key
@@ -1425,70 +1776,72 @@ class BLEInterface(Interface):
             RNS.log(f"{self} no identity for peer {peer_address}, dropping data", RNS.LOG_WARNING)
             return
 
-        # Compute identity-based fragmenter key (matches peripheral data handler)
-        frag_key = self._get_fragmenter_key(peer_identity, peer_address)
+        self._dispatch_fragment(peer_identity, peer_address, data)
 
-        # Attempt reassembly
-        complete_packet = None
-        peer_name = None
+    def _dispatch_fragment(self, peer_identity, address, data):
+        """
+        Reassemble a fragment from an identified peer and route any complete packet.
 
-        # HIGH #2: Lock ordering - get reassembler reference with frag_lock, release before processing
-        # This prevents holding frag_lock during reassembly which could block other threads
-        with self.frag_lock:
-            if frag_key not in self.reassemblers:
-                RNS.log(f"{self} no reassembler for {peer_address} (key: {frag_key[:16]}), dropping data", RNS.LOG_WARNING)
-                return
-            reassembler = self.reassemblers[frag_key]
+        Shared by the central (driver) and peripheral (GATT server) RX paths once
+        the sender's identity is known.
 
-        # Process fragment without holding lock (reassemblers are per-peer, no contention)
-        try:
-            # Ensure data is bytes (Bleak notifications may return bytearray)
-            data_bytes = bytes(data) if not isinstance(data, bytes) else data
-            complete_packet = reassembler.receive_fragment(data_bytes, peer_address)
-
-            # Periodic cleanup of stale buffers (if packet complete)
-            if complete_packet:
-                cleaned = reassembler.cleanup_stale_buffers()
-                if cleaned > 0:
-                    RNS.log(f"{self} cleaned {cleaned} stale reassembly buffers for {peer_address}", RNS.LOG_DEBUG)
-
-                # Log fragmentation statistics for this peer
-                stats = reassembler.get_statistics()
-                # Get peer name from interface lookup
-                peer_identity = self.address_to_identity.get(peer_address, None)
-
-                peer_name = peer_address[-8:]  # Default to address
-                if peer_identity:
-                    identity_hash = self._compute_identity_hash(peer_identity)
-                    peer_if = self.spawned_interfaces.get(identity_hash, None)
-                    if peer_if:
-                        peer_name = peer_if.peer_name
-
-                RNS.log(f"{self} reassembled packet from {peer_name}: "
-                        f"total_packets={stats['packets_reassembled']}, "
-                        f"total_fragments={stats['fragments_received']}, "
-                        f"pending={stats['pending_packets']}, "
-                        f"timeouts={stats['packets_timeout']}", RNS.LOG_DEBUG)
+        Args:
+            peer_identity: 16-byte identity of the sender
+            address: BLE address the fragment was received from
+            data: Raw fragment (bytes, bytearray or dbus.Array)
+        """
+        frag_key = self._get_fragmenter_key(peer_identity, address)
+
+        # Lock-free read: writers replace self.reassemblers wholesale under frag_lock,
+        # so the dict seen here is never mutated
+        reassembler = self.reassemblers.get(frag_key)
+        if reassembler is None:
+            RNS.log(f"{self} no reassembler for {address} (key: {frag_key[:8].hex()}), dropping data", RNS.LOG_WARNING)
+            return
 
+        # Process fragment without holding any lock (reassemblers are per-peer)
+        try:
+            complete_packet = reassembler.receive_fragment(_to_bytes(data), address)
         except Exception as e:
-            RNS.log(f"{self} error reassembling fragment from {peer_address}: {type(e).__name__}: {e}", RNS.LOG_ERROR)
+            RNS.log(f"{self} error reassembling fragment from {address}: {type(e).__name__}: {e}", RNS.LOG_ERROR)
             return
 
-        # If we have a complete packet, route to peer interface
         if complete_packet:
-            peer_identity = self.address_to_identity.get(peer_address, None)
+            self._route_reassembled_packet(address, peer_identity, reassembler, complete_packet)
 
-            if not peer_identity:
-                RNS.log(f"{self} no identity for peer {peer_address}, packet dropped", RNS.LOG_WARNING)
-                return
+            # Stale buffers are swept across all peers, rate limited
+            self._maybe_sweep_reassemblers()
 
-            identity_hash = self._compute_identity_hash(peer_identity)
-            peer_if = self.spawned_interfaces.get(identity_hash, None)
+    def _route_reassembled_packet(self, address, peer_identity, reassembler, packet):
+        """
+        Deliver a reassembled packet to its peer interface.
 
-            if peer_if:
-                peer_if.process_incoming(complete_packet)
-            else:
-                RNS.log(f"{self} no interface found for peer {peer_address}, packet dropped", RNS.LOG_WARNING)
+        The peer interface is resolved once and used for both the statistics
+        log and routing.
+
+        Args:
+            address: BLE address the packet was received from
+            peer_identity: 16-byte identity of the sender
+            reassembler: BLEReassembler that produced the packet
+            packet: Complete reassembled packet
+        """
+        identity_hash = self._get_identity_hash(address, peer_identity)
+        peer_if = self.spawned_interfaces.get(identity_hash, None)
+
+        # Log fragmentation statistics for this peer
+        if RNS.loglevel >= RNS.LOG_DEBUG:
+            stats = reassembler.get_statistics()
+            peer_name = peer_if.peer_name if peer_if else self._suffix(address)
+            RNS.log(f"{self} reassembled packet from {peer_name}: "
+                    f"total_packets={stats['packets_reassembled']}, "
+                    f"total_fragments={stats['fragments_received']}, "
+                    f"pending={stats['pending_packets']}, "
+                    f"timeouts={stats['packets_timeout']}", RNS.LOG_DEBUG)
+
+        if peer_if:
+            peer_if.process_incoming(packet)
+        else:
+            RNS.log(f"{self} no interface found for peer {address}, packet dropped", RNS.LOG_WARNING)
 
     def handle_peripheral_data(self, data, sender_address):
         """
@@ -1500,12 +1853,15 @@ class BLEInterface(Interface):
             data: Raw bytes received from central
             sender_address: BLE address of the central device
         """
-        RNS.log(f"{self} received {len(data)} bytes from central {sender_address}", RNS.LOG_EXTREME)
+        extreme = RNS.loglevel >= RNS.LOG_EXTREME
+        if extreme:
+            RNS.log(f"{self} received {len(data)} bytes from central {sender_address}", RNS.LOG_EXTREME)
 
         # Filter 1-byte keep-alive packets from Columba (Android) peers
         # Columba sends 0x00 every 15 seconds to prevent Android BLE supervision timeout
         if len(data) == 1 and data[0] == 0x00:
-            RNS.log(f"{self} received keep-alive from central {sender_address}, ignoring", RNS.LOG_EXTREME)
+            if extreme:
+                RNS.log(f"{self} received keep-alive from central {sender_address}, ignoring", RNS.LOG_EXTREME)
             return
 
         # Check if we have peer identity
@@ -1516,19 +1872,20 @@ class BLEInterface(Interface):
         if not peer_identity and len(data) == 16:
             try:
                 # Store central's identity
-                central_identity = bytes(data)
-                central_identity_hash = RNS.Identity.full_hash(central_identity)[:16].hex()[:16]
+                central_identity = _to_bytes(data)
+                central_identity_hash = self._compute_identity_hash(central_identity)
 
                 self.address_to_identity[sender_address] = central_identity
+                self.address_to_identity_hash[sender_address] = central_identity_hash
                 self.identity_to_address[central_identity_hash] = sender_address
 
-                RNS.log(f"{self} received identity handshake from central {sender_address}: {central_identity_hash}", RNS.LOG_INFO)
+                RNS.log(f"{self} received identity handshake from central {sender_address}: {central_identity_hash.hex()}", RNS.LOG_INFO)
                 RNS.log(f"{self} stored identity mapping for {sender_address}", RNS.LOG_DEBUG)
 
                 # Create peer interface and fragmenter/reassembler now that we have identity
                 self._spawn_peer_interface(
                     address=sender_address,
-                    name=f"Central-{sender_address[-8:]}",
+                    name=f"Central-{self._suffix(sender_address)}",
                     peer_identity=central_identity,
                     client=None,  # No client for peripheral connections
                     mtu=None,  # MTU managed by GATT server
@@ -1541,9 +1898,12 @@ class BLEInterface(Interface):
                     # Use default MTU for peripheral connections (GATT server manages MTU)
                     # The actual MTU will be determined by the central device
                     mtu = 23  # BLE 4.0 minimum MTU
-                    self.fragmenters[frag_key] = BLEFragmenter(mtu=mtu)
-                    self.reassemblers[frag_key] = BLEReassembler(timeout=self.connection_timeout)
-                RNS.log(f"{self} created fragmenter/reassembler for central (key: {frag_key[:16]})", RNS.LOG_DEBUG)
+                    self._ensure_fragmenter(frag_key, mtu)
+                    old_reassembler = self._put_reassembler(
+                        frag_key, self._create_reassembler(timeout=self.connection_timeout))
+                if old_reassembler is not None:
+                    self._release_reassembler(old_reassembler)
+                RNS.log(f"{self} created fragmenter/reassembler for central (key: {frag_key[:8].hex()})", RNS.LOG_DEBUG)
 
                 return  # Handshake processed, done
             except Exception as e:
@@ -1555,42 +1915,7 @@ class BLEInterface(Interface):
             RNS.log(f"{self} no identity for central {sender_address}, dropping data", RNS.LOG_WARNING)
             return
 
-        # Get fragmenter key
-        frag_key = self._get_fragmenter_key(peer_identity, sender_address)
-
-        # Attempt reassembly
-        complete_packet = None
-        with self.frag_lock:
-            if frag_key not in self.reassemblers:
-                RNS.log(f"{self} no reassembler for {sender_address}, dropping data", RNS.LOG_WARNING)
-                return
-
-            reassembler = self.reassemblers[frag_key]
-
-        try:
-            # Ensure data is bytes (bluezero may pass different types)
-            data_bytes = bytes(data) if not isinstance(data, bytes) else data
-            complete_packet = reassembler.receive_fragment(data_bytes, sender_address)
-
-            # Periodic cleanup
-            if complete_packet:
-                cleaned = reassembler.cleanup_stale_buffers()
-                if cleaned > 0:
-                    RNS.log(f"{self} cleaned {cleaned} stale reassembly buffers for {sender_address}", RNS.LOG_DEBUG)
-
-        except Exception as e:
-            RNS.log(f"{self} error reassembling fragment from {sender_address}: {type(e).__name__}: {e}", RNS.LOG_ERROR)
-            return
-
-        # Route complete packet to interface
-        if complete_packet:
-            identity_hash = self._compute_identity_hash(peer_identity)
-            peer_if = self.spawned_interfaces.get(identity_hash)
-
-            if peer_if:
-                peer_if.process_incoming(complete_packet)
-            else:
-                RNS.log(f"{self} no interface for {sender_address}, packet dropped", RNS.LOG_WARNING)
+        self._dispatch_fragment(peer_identity, sender_address, data)
 
     def handle_central_connected(self, address):
         """
@@ -1619,7 +1944,7 @@ class BLEInterface(Interface):
         # Create peer interface with peripheral connection
         self._spawn_peer_interface(
             address=address,
-            name=f"Central-{address[-8:]}",
+            name=f"Central-{self._suffix(address)}",
             peer_identity=peer_identity,
             client=None,  # No client for peripheral connections
             mtu=None,  # MTU managed by GATT server
@@ -1634,6 +1959,7 @@ class BLEInterface(Interface):
             address: BLE address of the central device
         """
         RNS.log(f"{self} central disconnected: {address}", RNS.LOG_INFO)
+        self._invalidate_peer_selection()
 
         # Look up peer identity
         peer_identity = self.address_to_identity.get(address, None)
@@ -1643,30 +1969,37 @@ class BLEInterface(Interface):
             return
 
         # Find and detach interface
-        identity_hash = self._compute_identity_hash(peer_identity)
-        if identity_hash in self.spawned_interfaces:
-            peer_if = self.spawned_interfaces[identity_hash]
+        identity_hash = self._get_identity_hash(address, peer_identity)
+        peer_if = self.spawned_interfaces.pop(identity_hash, None)
+        if peer_if is not None:
+            with self.peer_lock:
+                self._online_peer_ifs = self._online_peer_ifs - {peer_if}
             peer_if.detach()
-            del self.spawned_interfaces[identity_hash]
             RNS.log(f"{self} detached interface for {address}", RNS.LOG_DEBUG)
 
             # Clean up identity mappings to prevent stale connections
-            if address in self.address_to_identity:
-                del self.address_to_identity[address]
+            if self.address_to_identity.pop(address, None) is not None:
                 RNS.log(f"{self} cleaned up address_to_identity for {address}", RNS.LOG_DEBUG)
-            if identity_hash in self.identity_to_address:
-                del self.identity_to_address[identity_hash]
-                RNS.log(f"{self} cleaned up identity_to_address for {identity_hash}", RNS.LOG_DEBUG)
+            self.address_to_identity_hash.pop(address, None)
+            self._identity_hash_cache.pop(peer_identity, None)
+            self._address_suffix_cache.pop(address, None)
+            if self.identity_to_address.pop(identity_hash, None) is not None:
+                RNS.log(f"{self} cleaned up identity_to_address for {identity_hash.hex()}", RNS.LOG_DEBUG)
+
+        # Clean up fragmenter/reassembler even if no interface was spawned, so
+        # partial packets from a central that vanished mid-handshake are freed.
+        # Skip if the identity is live under another address (MAC rotation).
+        if self.identity_to_address.get(identity_hash, address) != address:
+            return
 
-            # Clean up fragmenter/reassembler
-            frag_key = self._get_fragmenter_key(peer_identity, address)
-            with self.frag_lock:
-                if frag_key in self.reassemblers:
-                    del self.reassemblers[frag_key]
-                    RNS.log(f"{self} cleaned up reassembler for {address}", RNS.LOG_DEBUG)
-                if frag_key in self.fragmenters:
-                    del self.fragmenters[frag_key]
-                    RNS.log(f"{self} cleaned up fragmenter for {address}", RNS.LOG_DEBUG)
+        frag_key = self._get_fragmenter_key(peer_identity, address)
+        with self.frag_lock:
+            reassembler = self._pop_reassembler(frag_key)
+            if self._pop_fragmenter(frag_key) is not None:
+                RNS.log(f"{self} cleaned up fragmenter for {address}", RNS.LOG_DEBUG)
+        if reassembler is not None:
+            freed = self._release_reassembler(reassembler)
+            RNS.log(f"{self} cleaned up reassembler for {address} ({freed} pending buffer(s) freed)", RNS.LOG_DEBUG)
 
     def process_incoming(self, data):
         """
@@ -1676,11 +2009,15 @@ class BLEInterface(Interface):
             data: Raw packet data
         """
         # This will be called by spawned peer interfaces
-        # For now, just pass to owner
-        if self.online and self.owner:
-            self.rxb += len(data)
-            RNS.log(f"{self} RX: {len(data)} bytes from peer interface", RNS.LOG_DEBUG)
-            self.owner.inbound(data, self)
+        # For now, just pass to owner (bound only while online)
+        inbound = self._inbound
+        if inbound is None:
+            return
+        n = len(data)
+        self.rxb += n
+        if RNS.loglevel >= RNS.LOG_DEBUG:
+            RNS.log(f"{self} RX: {n} bytes from peer interface", RNS.LOG_DEBUG)
+        inbound(data, self)
 
     def process_outgoing(self, data):
         """
@@ -1700,37 +2037,53 @@ class BLEInterface(Interface):
         if not self.online:
             return
 
-        # Get snapshot of peers without holding lock during I/O operations
-        # This prevents deadlock when peer_if.process_outgoing() tries to acquire the same lock
-        with self.peer_lock:
-            peers_to_send = [(address, peer_if) for address, peer_if in self.spawned_interfaces.items() if peer_if.online]
+        # The online peer set is copy-on-write: writers replace it under peer_lock
+        # on connect/disconnect, so TX reads the current snapshot without locking
+        # or copying, and no lock is held while sending
+        peers_to_send = self._online_peer_ifs
 
         # Log packet transmission
-        RNS.log(f"{self} TX: {len(data)} bytes to {len(peers_to_send)} peer(s)", RNS.LOG_DEBUG)
+        if RNS.loglevel >= RNS.LOG_DEBUG:
+            RNS.log(f"{self} TX: {len(data)} bytes to {len(peers_to_send)} peer(s)", RNS.LOG_DEBUG)
 
-        # Send to each peer WITHOUT holding the lock (avoid deadlock)
-        for address, peer_if in peers_to_send:
-            peer_if.process_outgoing(data)
+        # Send to each peer WITHOUT holding the lock (avoid deadlock). Peers
+        # share one fragmentation per distinct MTU through fragment_cache.
+        fragment_cache = {} if len(peers_to_send) > 1 else None
+        for peer_if in peers_to_send:
+            peer_if.process_outgoing(data, fragment_cache)
 
     def detach(self):
         """Detach and shutdown the interface."""
         RNS.log(f"{self} detaching interface", RNS.LOG_INFO)
         self.online = False
+        self._inbound = None
+        for peer_if in self._online_peer_ifs:
+            peer_if._rx_enabled = False  # Stop delivery before the peers are detached
 
-        # Cancel periodic cleanup timer
-        if self.cleanup_timer:
-            self.cleanup_timer.cancel()
-            self.cleanup_timer = None
+        # Stop periodic cleanup thread
+        self._stop_event.set()
 
         # Detach spawned interfaces
-        for peer_if in list(self.spawned_interfaces.values()):
+        with self.peer_lock:
+            self._online_peer_ifs = frozenset()
+        # Swap in a fresh map so teardown iterates the old one without copying it,
+        # and anything spawned concurrently lands in the new map untouched
+        spawned, self.spawned_interfaces = self.spawned_interfaces, {}
+
+        # Drop all peer interfaces from Transport in one pass rather than one
+        # list search per peer, then detach them without touching the list again
+        detaching = set(spawned.values())
+        if detaching:
+            RNS.Transport.interfaces[:] = [i for i in RNS.Transport.interfaces if i not in detaching]
+        for peer_if in detaching:
+            peer_if._transport_index = None
             peer_if.detach()
-        self.spawned_interfaces.clear()
+        spawned.clear()
 
         # Clear fragmentation state
         with self.frag_lock:
-            self.fragmenters.clear()
-            self.reassemblers.clear()
+            self.fragmenters = {}
+            self.reassemblers = {}
 
         # Stop the driver (handles graceful disconnection and cleanup)
         try:
@@ -1752,8 +2105,30 @@ class BLEInterface(Interface):
         """
         return False
 
+    @property
+    def local_address(self):
+        return self._local_address
+
+    @local_address.setter
+    def local_address(self, address):
+        # Parsed once here for the per-peer connection direction check
+        self._local_address = address
+        self._local_mac_int = _mac_to_int(address) if address is not None else None
+        if address is not None and self._local_mac_int is None:
+            RNS.log(f"{self} could not parse local address {address}, MAC sorting disabled", RNS.LOG_DEBUG)
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        # __str__ is formatted into most log lines, so build it once per rename
+        self._name = name
+        self._str = f"BLEInterface[{name}]"
+
     def __str__(self):
-        return f"BLEInterface[{self.name}]"
+        return self._str
 
 
 class BLEPeerInterface(Interface):
@@ -1762,6 +2137,12 @@ class BLEPeerInterface(Interface):
 
     This follows the pattern used by AutoInterface to create per-peer
     interfaces for routing and statistics tracking.
+
+    txb counts bytes accepted by the driver, not bytes confirmed on air. For
+    central-role peers the driver only queues GATT writes, so packets later
+    dropped (queue full, failed or timed-out write, disconnect) are still
+    counted, and a failed write is reported by the driver on the next packet
+    to the peer, which is then not sent either.
     """
 
     def __init__(self, parent, peer_address, peer_name, peer_identity=None):
@@ -1781,8 +2162,10 @@ class BLEPeerInterface(Interface):
         self.parent_interface = parent
         self.peer_address = peer_address
         self.peer_name = peer_name
-        self.peer_identity = peer_identity  # 16-byte identity for stable tracking
+        self.peer_identity = peer_identity  # 16-byte identity for stable tracking (derives cached keys)
         self.online = True
+        self._rx_enabled = True  # online and parent online, cleared by either detach()
+        self._transport_index = None  # Position in RNS.Transport.interfaces; None when not registered
 
         # Copy settings from parent
         self.HW_MTU = parent.HW_MTU
@@ -1796,6 +2179,39 @@ class BLEPeerInterface(Interface):
 
         RNS.log(f"BLEPeerInterface initialized for {peer_name} ({peer_address}), identity={'set' if peer_identity else 'pending'}", RNS.LOG_DEBUG)
 
+    @property
+    def peer_name(self):
+        return self._peer_name
+
+    @peer_name.setter
+    def peer_name(self, peer_name):
+        # __str__ is formatted into per-packet log lines, so build it once per rename
+        self._peer_name = peer_name
+        self._str = f"BLEPeerInterface[{peer_name}]"
+
+    @property
+    def peer_identity(self):
+        """16-byte identity of this peer (None until learned)."""
+        return self._peer_identity
+
+    @peer_identity.setter
+    def peer_identity(self, peer_identity):
+        # Derive the lookup keys once here instead of on every packet. Both are
+        # computed before any attribute is touched so a concurrent send never
+        # sees a key belonging to the previous identity.
+        if peer_identity:
+            identity_hash = self.parent_interface._compute_identity_hash(peer_identity)
+            frag_key = self.parent_interface._get_fragmenter_key(peer_identity, self.peer_address)
+            connection_id = identity_hash[:4].hex()
+        else:
+            identity_hash = None
+            frag_key = None
+            connection_id = None
+        self._peer_identity = peer_identity
+        self._identity_hash = identity_hash
+        self._frag_key = frag_key
+        self._connection_id = connection_id
+
     def process_incoming(self, data):
         """
         Process incoming data from this peer.
@@ -1803,69 +2219,123 @@ class BLEPeerInterface(Interface):
         Args:
             data: Raw bytes received from peer
         """
-        if self.online and self.parent_interface.online:
-            self.rxb += len(data)
-            self.parent_interface.rxb += len(data)
+        if self._rx_enabled:
+            parent = self.parent_interface
+            n = len(data)
+            self.rxb += n
+            parent.rxb += n
 
             # Log packet reception
-            RNS.log(f"{self} RX: {len(data)} bytes from {self.peer_name}", RNS.LOG_DEBUG)
+            if RNS.loglevel >= RNS.LOG_DEBUG:
+                RNS.log(f"{self} RX: {n} bytes from {self.peer_name}", RNS.LOG_DEBUG)
 
             # Pass to Reticulum transport
-            self.parent_interface.owner.inbound(data, self)
+            parent.owner.inbound(data, self)
 
-    def process_outgoing(self, data):
+    def process_outgoing(self, data, fragment_cache=None):
         """
         Process outgoing data to send to this peer (with fragmentation).
 
         Args:
             data: Raw packet data to transmit
+            fragment_cache: Optional dict shared by the peers of one broadcast,
+                mapping payload size -> fragments, so the packet is fragmented
+                once per distinct MTU rather than once per peer
         """
         if not self.online:
             return
 
         # Log packet transmission
-        RNS.log(f"{self} TX: {len(data)} bytes to {self.peer_name}", RNS.LOG_DEBUG)
+        if RNS.loglevel >= RNS.LOG_DEBUG:
+            RNS.log(f"{self} TX: {len(data)} bytes to {self.peer_name}", RNS.LOG_DEBUG)
 
         # Get fragmenter for this peer (using identity-based key for MAC rotation immunity)
-        frag_key = self.parent_interface._get_fragmenter_key(self.peer_identity, self.peer_address)
+        frag_key = self._frag_key
 
-        with self.parent_interface.frag_lock:
-            if frag_key not in self.parent_interface.fragmenters:
-                RNS.log(f"No fragmenter for peer {self.peer_name} (key: {frag_key})", RNS.LOG_WARNING)
-                return
+        # Lock-free read: the parent replaces its fragmenters dict under frag_lock
+        # rather than mutating it (see BLEInterface._ensure_fragmenter)
+        fragmenter = self.parent_interface.fragmenters.get(frag_key)
+        if fragmenter is None:
+            RNS.log(f"No fragmenter for peer {self.peer_name} (key: {frag_key.hex() if frag_key else None})", RNS.LOG_WARNING)
+            return
 
-            fragmenter = self.parent_interface.fragmenters[frag_key]
+        # Fragments depend only on the data and payload size (fragmenters keep
+        # no per-peer state), so peers with the same MTU can share them
+        payload_size = fragmenter.payload_size
+        fragments = fragment_cache.get(payload_size) if fragment_cache is not None else None
 
-        # Fragment the data
-        try:
-            fragments = fragmenter.fragment_packet(data)
+        if fragments is None:
+            # Single-fragment fast path: most packets fit in one fragment
+            fragment = fragmenter.fragment_single(data)
+            if fragment is not None:
+                fragments = (fragment,)
+            else:
+                # Fragment the data
+                try:
+                    fragments = fragmenter.fragment_packet(data)
 
-            if len(fragments) > 1:
-                RNS.log(f"Fragmenting {len(data)} byte packet into {len(fragments)} fragments for {self.peer_name}", RNS.LOG_EXTREME)
+                    if len(fragments) > 1 and RNS.loglevel >= RNS.LOG_EXTREME:
+                        RNS.log(f"Fragmenting {len(data)} byte packet into {len(fragments)} fragments for {self.peer_name}", RNS.LOG_EXTREME)
 
-        except Exception as e:
-            RNS.log(f"Failed to fragment data for {self.peer_name}: {e}", RNS.LOG_ERROR)
-            return
+                except Exception as e:
+                    RNS.log(f"Failed to fragment data for {self.peer_name}: {e}", RNS.LOG_ERROR)
+                    return
+
+            if fragment_cache is not None:
+                fragment_cache[payload_size] = fragments
 
-        # Send fragments via driver (driver handles role-aware routing)
-        for i, fragment in enumerate(fragments):
+        fragment = fragments[0] if len(fragments) == 1 else None
+
+        # Send fragments via driver (driver handles role-aware routing). For
+        # central-role peers this only queues the writes: txb counts what the
+        # driver accepted, and an exception may report an earlier packet's
+        # failed write (see class docstring)
+        if fragment is not None:
             try:
                 self.parent_interface.driver.send(self.peer_address, fragment)
 
-                self.txb += len(fragment)
-                self.parent_interface.txb += len(fragment)
+                sent_bytes = len(fragment)
+                self.txb += sent_bytes
+                self.parent_interface.txb += sent_bytes
 
             except Exception as e:
-                RNS.log(f"Failed to send fragment {i+1}/{len(fragments)} to {self.peer_name}: {e}", RNS.LOG_ERROR)
-                return
+                RNS.log(f"Failed to send fragment 1/1 to {self.peer_name}: {e}", RNS.LOG_ERROR)
+            return
+
+        # Multi-fragment packets are handed to the driver in one call so it can
+        # submit them together instead of one blocking round trip per fragment
+        try:
+            self.parent_interface.driver.send_fragments(self.peer_address, fragments)
+
+            # Every fragment is payload + fixed header, so the total is known
+            # without walking the fragment list
+            sent_bytes = len(data) + BLEFragmenter.HEADER_SIZE * len(fragments)
+            self.txb += sent_bytes
+            self.parent_interface.txb += sent_bytes
+
+        except Exception as e:
+            RNS.log(f"Failed to send {len(fragments)} fragments to {self.peer_name}: {e}", RNS.LOG_ERROR)
 
     def detach(self):
         """Detach this peer interface."""
+        self._rx_enabled = False
         self.online = False
 
-        # Remove from transport
-        if self in RNS.Transport.interfaces:
-            RNS.Transport.interfaces.remove(self)
+        # Remove from transport. The slot recorded at registration is checked
+        # first; it is only stale if interfaces before it were removed since.
+        # Interfaces that were never registered (or were already removed in
+        # bulk by BLEInterface.detach) skip the list entirely.
+        index = self._transport_index
+        if index is not None:
+            self._transport_index = None
+            interfaces = RNS.Transport.interfaces
+            if index < len(interfaces) and interfaces[index] is self:
+                del interfaces[index]
+            else:
+                try:
+                    interfaces.remove(self)
+                except ValueError:
+                    pass
 
         RNS.log(f"BLEPeerInterface detached for {self.peer_name}", RNS.LOG_DEBUG)
 
@@ -1877,17 +2347,13 @@ class BLEPeerInterface(Interface):
     def connection_id(self):
         """Get the unique connection ID for this peer interface"""
         # For unified interfaces, use identity hash if available, otherwise address
-        if self.peer_identity:
-            try:
-                import RNS
-                identity_hash = RNS.Identity.full_hash(self.peer_identity)[:16].hex()[:8]
-                return f"{identity_hash}"
-            except:
-                pass
+        # (the hex form is derived once in the peer_identity setter)
+        if self._connection_id:
+            return self._connection_id
         return f"{self.peer_address}"
 
     def __str__(self):
-        return f"BLEPeerInterface[{self.peer_name}]"
+        return self._str
 
 
 # Register interface for Reticulum
@@ -150,6 +150,17 @@ class BLEDriverInterface(ABC):
         """
         pass
 
+    def send_fragments(self, address: str, fragments: List[bytes]):
+        """
+        Sends a sequence of fragments belonging to one packet to a connected peer.
+
+        Fragments must be delivered in order. The default implementation calls
+        send() for each fragment; drivers may override this to submit the whole
+        packet in a single operation. Raises on the first failed fragment.
+        """
+        for fragment in fragments:
+            self.send(address, fragment)
+
     # --- GATT Characteristic Operations ---
 
     @abstractmethod
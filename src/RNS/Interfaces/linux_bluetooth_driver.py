@@ -124,6 +124,7 @@ import logging
 import warnings
 from typing import Optional, Callable, List, Dict
 from dataclasses import dataclass
+from collections import deque
 
 # Import RNS for logging
 try:
@@ -132,6 +133,17 @@ except ImportError:
     # Fallback for when RNS is not available (standalone testing)
     RNS = None
 
+# Driver log level names -> RNS log levels (unknown names log at INFO)
+if RNS:
+    _RNS_LOG_LEVELS = {
+        "DEBUG": RNS.LOG_DEBUG,
+        "INFO": RNS.LOG_INFO,
+        "WARNING": RNS.LOG_WARNING,
+        "ERROR": RNS.LOG_ERROR,
+        "CRITICAL": RNS.LOG_CRITICAL,
+        "EXTREME": RNS.LOG_EXTREME,
+    }
+
 # Capture Python warnings and route them through RNS logger
 def _rns_showwarning(message, category, filename, lineno, file=None, line=None):
     """Custom warning handler that routes warnings to RNS logger."""
@@ -303,8 +315,14 @@ class LinuxBluetoothDriver(BLEDriverInterface):
     - Main thread: User-facing API (start, stop, send, etc.)
     - Event loop thread: All async BLE operations
     - Cross-thread communication via run_coroutine_threadsafe
+    - Central-role writes are queued to a per-peer loop-side TX pump (non-blocking send)
     """
 
+    # Maximum queued central-role packets per peer before new ones are dropped
+    TX_QUEUE_SIZE = 256
+    # Seconds allowed for the GATT writes of one queued packet
+    TX_WRITE_TIMEOUT = 5.0
+
     def __init__(
         self,
         discovery_interval: float = 5.0,
@@ -346,6 +364,9 @@ class LinuxBluetoothDriver(BLEDriverInterface):
         self.rx_char_uuid: Optional[str] = None
         self.tx_char_uuid: Optional[str] = None
         self.identity_char_uuid: Optional[str] = None
+        # Lowercased copies for case-insensitive matching against advertisements and GATT tables
+        self._service_uuid_lower: Optional[str] = None
+        self._identity_char_uuid_lower: Optional[str] = None
 
         # State
         self._state = DriverState.IDLE
@@ -374,6 +395,13 @@ class LinuxBluetoothDriver(BLEDriverInterface):
         self.loop: Optional[asyncio.AbstractEventLoop] = None
         self.loop_thread: Optional[threading.Thread] = None
 
+        # Central-role TX queues, one per peer, each drained by its own
+        # _tx_pump() task on the event loop (event loop thread only)
+        self._tx_queues: Dict[str, deque] = {}  # address -> deque of per-packet fragment lists
+        self._tx_pumps: Dict[str, asyncio.Task] = {}  # address -> running pump
+        self._tx_errors: Dict[str, Exception] = {}  # address -> last failed write, raised by next send()
+        self.tx_dropped = 0  # Packets dropped (queue full, or discarded after a failed write)
+
         # Peripheral mode (bluezero)
         self.gatt_server: Optional['BluezeroGATTServer'] = None
         self.ble_agent = None
@@ -394,20 +422,23 @@ class LinuxBluetoothDriver(BLEDriverInterface):
         # Detect BlueZ version
         self._detect_bluez_version()
 
+    def _log_enabled(self, level: str) -> bool:
+        """
+        Check whether a message at this level would be logged.
+
+        Hot paths use this to skip building the message string entirely.
+        """
+        if RNS:
+            return RNS.loglevel >= _RNS_LOG_LEVELS.get(level.upper(), RNS.LOG_INFO)
+        return True
+
     def _log(self, message: str, level: str = "INFO"):
         """Log message with appropriate level."""
         if RNS:
             # Map Python logging level strings to RNS log levels
-            level_map = {
-                "DEBUG": RNS.LOG_DEBUG,
-                "INFO": RNS.LOG_INFO,
-                "WARNING": RNS.LOG_WARNING,
-                "ERROR": RNS.LOG_ERROR,
-                "CRITICAL": RNS.LOG_CRITICAL,
-                "EXTREME": RNS.LOG_EXTREME,
-            }
-            rns_level = level_map.get(level.upper(), RNS.LOG_INFO)
-            RNS.log(f"{self.log_prefix} {message}", rns_level)
+            rns_level = _RNS_LOG_LEVELS.get(level.upper(), RNS.LOG_INFO)
+            if RNS.loglevel >= rns_level:
+                RNS.log(f"{self.log_prefix} {message}", rns_level)
         else:
             # Fallback to standard Python logging if RNS not available
             log_func = getattr(logging, level.lower(), logging.info)
@@ -434,6 +465,8 @@ class LinuxBluetoothDriver(BLEDriverInterface):
         self.rx_char_uuid = rx_char_uuid
         self.tx_char_uuid = tx_char_uuid
         self.identity_char_uuid = identity_char_uuid
+        self._service_uuid_lower = service_uuid.lower() if service_uuid else None
+        self._identity_char_uuid_lower = identity_char_uuid.lower() if identity_char_uuid else None
 
         # Start event loop thread
         self.loop_thread = threading.Thread(target=self._run_event_loop, daemon=True, name="BLE-EventLoop")
@@ -511,6 +544,14 @@ class LinuxBluetoothDriver(BLEDriverInterface):
             except Exception as e:
                 self._log(f"Error stopping GATT server: {e}", "WARNING")
 
+        # Cancel pending central-role writes before the loop goes away
+        if self.loop and self.loop.is_running():
+            future = asyncio.run_coroutine_threadsafe(self._cancel_tx_pumps(), self.loop)
+            try:
+                future.result(timeout=2.0)
+            except Exception as e:
+                self._log(f"Error cancelling TX pumps: {e}", "WARNING")
+
         # Stop event loop
         if self.loop and self.loop.is_running():
             self.loop.call_soon_threadsafe(self.loop.stop)
@@ -637,11 +678,13 @@ class LinuxBluetoothDriver(BLEDriverInterface):
 
         discovered_devices = []
         callback_count = [0]  # Use list to allow modification in nested function
+        log_extra = self._log_enabled("EXTRA")  # Per-device logs below are skipped unless enabled
 
         def detection_callback(device, advertisement_data):
             """Called for each discovered device."""
             callback_count[0] += 1
-            self._log(f"🔍 CALLBACK INVOKED: {device.address} ({device.name or 'Unknown'}) RSSI={advertisement_data.rssi} UUIDs={advertisement_data.service_uuids}", "EXTRA")
+            if log_extra:
+                self._log(f"🔍 CALLBACK INVOKED: {device.address} ({device.name or 'Unknown'}) RSSI={advertisement_data.rssi} UUIDs={advertisement_data.service_uuids}", "EXTRA")
             discovered_devices.append((device, advertisement_data))
 
         # Scan duration based on power mode
@@ -702,22 +745,27 @@ class LinuxBluetoothDriver(BLEDriverInterface):
 
         # Process discovered devices
         self._log(f"🔍 Processing {len(discovered_devices)} discovered devices", "EXTRA")
+        service_uuid_lower = self._service_uuid_lower
         for device, adv_data in discovered_devices:
             # Check if device advertises our service UUID
-            if self.service_uuid and self.service_uuid.lower() in [uuid.lower() for uuid in adv_data.service_uuids]:
-                self._log(f"✓ {device.address} has service UUID {self.service_uuid}", "EXTRA")
+            if service_uuid_lower and any(uuid.lower() == service_uuid_lower for uuid in adv_data.service_uuids):
+                if log_extra:
+                    self._log(f"✓ {device.address} has service UUID {self.service_uuid}", "EXTRA")
 
                 # Check RSSI threshold
                 if adv_data.rssi < self.min_rssi:
-                    self._log(f"✗ {device.address}: RSSI {adv_data.rssi} below threshold {self.min_rssi}", "EXTRA")
+                    if log_extra:
+                        self._log(f"✗ {device.address}: RSSI {adv_data.rssi} below threshold {self.min_rssi}", "EXTRA")
                     continue
 
                 # Check for invalid/sentinel RSSI values (-127, -128 indicate no signal/error)
                 if adv_data.rssi in (-127, -128, 0):
-                    self._log(f"✗ {device.address}: invalid sentinel RSSI {adv_data.rssi} dBm", "DEBUG")
+                    if self._log_enabled("DEBUG"):
+                        self._log(f"✗ {device.address}: invalid sentinel RSSI {adv_data.rssi} dBm", "DEBUG")
                     continue
 
-                self._log(f"✓ {device.address} passed all filters, notifying callback", "EXTRA")
+                if log_extra:
+                    self._log(f"✓ {device.address} passed all filters, notifying callback", "EXTRA")
 
                 # Create BLEDevice and notify callback
                 ble_device = BLEDevice(
@@ -889,8 +937,8 @@ class LinuxBluetoothDriver(BLEDriverInterface):
 
         # Clean up
         with self._peers_lock:
-            if address in self._peers:
-                del self._peers[address]
+            self._peers.pop(address, None)
+        self._discard_tx_queue(address)
 
         if self.on_device_disconnected:
             try:
@@ -917,8 +965,7 @@ class LinuxBluetoothDriver(BLEDriverInterface):
 
         # Clean up from _peers dictionary
         with self._peers_lock:
-            if address in self._peers:
-                del self._peers[address]
+            if self._peers.pop(address, None) is not None:
                 self._log(f"Removed {address} from _peers (peripheral disconnect)", "DEBUG")
             else:
                 self._log(f"Central {address} not in _peers during disconnect", "DEBUG")
@@ -994,8 +1041,8 @@ class LinuxBluetoothDriver(BLEDriverInterface):
 
                 # Clean up
                 with self._peers_lock:
-                    if address in self._peers:
-                        del self._peers[address]
+                    self._peers.pop(address, None)
+                self._discard_tx_queue(address)
 
                 if self.on_device_disconnected:
                     try:
@@ -1068,7 +1115,7 @@ class LinuxBluetoothDriver(BLEDriverInterface):
             # Find Reticulum service
             reticulum_service = None
             for svc in services:
-                if svc.uuid.lower() == self.service_uuid.lower():
+                if svc.uuid.lower() == self._service_uuid_lower:
                     reticulum_service = svc
                     break
 
@@ -1081,7 +1128,7 @@ class LinuxBluetoothDriver(BLEDriverInterface):
             identity_read_start = time.time()
             peer_identity = None
             for char in reticulum_service.characteristics:
-                if char.uuid.lower() == self.identity_char_uuid.lower():
+                if char.uuid.lower() == self._identity_char_uuid_lower:
                     identity_value = await client.read_gatt_char(char)
                     if len(identity_value) == 16:
                         peer_identity = bytes(identity_value)
@@ -1127,6 +1174,7 @@ class LinuxBluetoothDriver(BLEDriverInterface):
 
             with self._peers_lock:
                 self._peers[address] = peer_conn
+            self._tx_errors.pop(address, None)  # Failures from a previous connection
 
             # Set up notifications
             notification_setup_start = time.time()
@@ -1327,6 +1375,12 @@ class LinuxBluetoothDriver(BLEDriverInterface):
         Send data to a connected peer.
 
         Automatically chooses GATT write (central) or notification (peripheral).
+
+        Central-role writes are only queued: send() returns before the data is
+        written and does not raise when that write later fails or times out.
+        A failed write is instead raised by the next send() to the same peer,
+        after the peer's remaining queued packets have been discarded.
+        Notifications (peripheral role) are sent synchronously and raise directly.
         """
         with self._peers_lock:
             if address not in self._peers:
@@ -1335,16 +1389,8 @@ class LinuxBluetoothDriver(BLEDriverInterface):
             peer = self._peers[address]
 
         if peer.connection_type == "central":
-            # We connected to them: use GATT write
-            future = asyncio.run_coroutine_threadsafe(
-                peer.client.write_gatt_char(self.rx_char_uuid, data, response=False),
-                self.loop
-            )
-            try:
-                future.result(timeout=5.0)
-            except Exception as e:
-                self._log(f"Error sending data to {address}: {e}", "ERROR")
-                raise
+            # We connected to them: queue GATT write for the event loop TX pump
+            self._queue_write(address, (data,))
 
         elif peer.connection_type == "peripheral":
             # They connected to us: use notification
@@ -1360,6 +1406,159 @@ class LinuxBluetoothDriver(BLEDriverInterface):
         else:
             raise RuntimeError(f"Unknown connection type: {peer.connection_type}")
 
+    def send_fragments(self, address: str, fragments: List[bytes]):
+        """
+        Send all fragments of one packet to a connected peer.
+
+        For central connections the whole packet is queued to the event loop
+        TX pump as one item, so its fragments are written back to back. As with
+        send(), this returns before the writes complete, and a failed write is
+        raised by the next call for the same peer.
+        """
+        if len(fragments) == 1:
+            self.send(address, fragments[0])
+            return
+
+        with self._peers_lock:
+            if address not in self._peers:
+                raise RuntimeError(f"Not connected to {address}")
+
+            peer = self._peers[address]
+
+        if peer.connection_type == "central":
+            # We connected to them: queue all GATT writes of the packet as one item
+            self._queue_write(address, fragments)
+
+        elif peer.connection_type == "peripheral":
+            # They connected to us: use notifications (synchronous, no loop hop)
+            if self.gatt_server:
+                try:
+                    for fragment in fragments:
+                        self.gatt_server.send_notification(address, fragment)
+                except Exception as e:
+                    self._log(f"Error sending notification to {address}: {e}", "ERROR")
+                    raise
+            else:
+                raise RuntimeError("GATT server not available for peripheral connection")
+
+        else:
+            raise RuntimeError(f"Unknown connection type: {peer.connection_type}")
+
+    def _queue_write(self, address: str, fragments):
+        """
+        Hand a packet's fragments to the peer's event loop TX pump without blocking.
+
+        Called from any thread. Raises the error of an earlier queued write to
+        this peer, if one failed since the last call; the packet is then not queued.
+        """
+        if self.loop is None:
+            raise RuntimeError("Event loop not running")
+
+        error = self._tx_errors.pop(address, None)
+        if error is not None:
+            raise RuntimeError(f"Earlier write to {address} failed: {error}") from error
+
+        self.loop.call_soon_threadsafe(self._enqueue_write, address, fragments)
+
+    def _enqueue_write(self, address: str, fragments):
+        """Queue a packet for the peer (event loop thread), starting its pump if idle."""
+        queue = self._tx_queues.get(address)
+        if queue is None:
+            queue = self._tx_queues[address] = deque()
+        elif len(queue) >= self.TX_QUEUE_SIZE:
+            self.tx_dropped += 1
+            self._log(f"TX queue full, dropped packet to {address} (total dropped: {self.tx_dropped})", "WARNING")
+            return
+
+        queue.append(fragments)
+        if address not in self._tx_pumps:
+            self._tx_pumps[address] = self.loop.create_task(self._tx_pump(address, queue))
+
+    async def _tx_pump(self, address: str, queue: deque):
+        """
+        Write one peer's queued packets in order (runs on the event loop).
+
+        Exits once the queue is empty; the next queued packet starts a new pump.
+        The peer's client is looked up for each packet, so writes always go to
+        the current connection. Each packet gets TX_WRITE_TIMEOUT seconds. On a
+        failed or timed-out write the peer's remaining packets are discarded, so
+        a stuck peer never delays writes to other peers and never holds a
+        backlog of stale data.
+        """
+        write_all = self._write_all
+        timeout = self.TX_WRITE_TIMEOUT
+        peers = self._peers
+        task = asyncio.current_task()
+        try:
+            while queue:
+                fragments = queue.popleft()
+                # Plain dict read, no _peers_lock: stop() holds that lock while
+                # it waits on this loop to disconnect peers
+                peer = peers.get(address)
+                try:
+                    if peer is None or peer.client is None:
+                        raise RuntimeError(f"Not connected to {address}")
+                    await asyncio.wait_for(write_all(peer.client, fragments), timeout=timeout)
+                except Exception as e:
+                    if isinstance(e, asyncio.TimeoutError):
+                        e = TimeoutError(f"GATT write timed out after {timeout}s")
+                    discarded = len(queue)
+                    queue.clear()
+                    self.tx_dropped += discarded
+                    # Only report to senders if this queue still belongs to the
+                    # peer (it is dropped on disconnect, see _discard_tx_queue)
+                    if self._tx_queues.get(address) is queue:
+                        self._tx_errors[address] = e
+                    self._log(f"Error sending {len(fragments)} fragment(s) to {address}: {e} "
+                              f"({discarded} queued packet(s) discarded)", "ERROR")
+        finally:
+            if self._tx_pumps.get(address) is task:
+                del self._tx_pumps[address]
+            if self._tx_queues.get(address) is queue:
+                del self._tx_queues[address]
+
+    def _discard_tx_queue(self, address: str):
+        """
+        Drop a disconnected peer's queued writes, running pump and pending error.
+
+        Called from any thread; the queue and pump are dropped on the event loop.
+        """
+        self._tx_errors.pop(address, None)
+        if self.loop is not None and not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self._drop_tx_queue, address)
+
+    def _drop_tx_queue(self, address: str):
+        """Cancel one peer's TX pump and discard its queue (event loop thread)."""
+        task = self._tx_pumps.pop(address, None)
+        queue = self._tx_queues.pop(address, None)
+        self._tx_errors.pop(address, None)
+        if task is not None:
+            task.cancel()
+        if queue:
+            self.tx_dropped += len(queue)
+            self._log(f"Discarded {len(queue)} queued packet(s) to disconnected peer {address}", "DEBUG")
+
+    async def _cancel_tx_pumps(self):
+        """Cancel all TX pumps and discard their queued packets (event loop thread)."""
+        pumps = list(self._tx_pumps.values())
+        discarded = sum(len(queue) for queue in self._tx_queues.values())
+        for task in pumps:
+            task.cancel()
+        if pumps:
+            await asyncio.gather(*pumps, return_exceptions=True)
+        self._tx_pumps.clear()  # Pumps cancelled before their first step never reach their cleanup
+        self._tx_queues.clear()
+        if discarded:
+            self.tx_dropped += discarded
+            self._log(f"Discarded {discarded} queued packet(s) on stop", "WARNING")
+
+    async def _write_all(self, client: BleakClient, fragments):
+        """Write fragments in order to the peer's RX characteristic."""
+        write = client.write_gatt_char
+        uuid = self.rx_char_uuid
+        for fragment in fragments:
+            await write(uuid, fragment, response=False)
+
     # ========================================================================
     # GATT Characteristic Operations
     # ========================================================================
@@ -1856,8 +2055,7 @@ class BluezeroGATTServer:
                             if RNS:
                                 RNS.log(f"{self.log_prefix} [GATT-MONITOR] Device removed: {path}", RNS.LOG_EXTREME)
                             # Clean up proxy
-                            if path in device_proxies:
-                                del device_proxies[path]
+                            device_proxies.pop(path, None)
                     except Exception as e:
                         if RNS:
                             RNS.log(f"{self.log_prefix} [GATT-MONITOR] Error in InterfacesRemoved handler: {e}", RNS.LOG_EXTREME)
@@ -2293,10 +2491,8 @@ class BluezeroGATTServer:
 
     def _handle_write_rx(self, value, options):
         """Handle write to RX characteristic (bluezero callback)."""
-        # Convert to bytes
-        if isinstance(value, list):
-            data = bytes(value)
-        elif isinstance(value, bytes):
+        # Convert to bytes (dbus.Array of ints -> single C-level conversion)
+        if type(value) is bytes:
             data = value
         else:
             data = bytes(value)
@@ -2308,7 +2504,8 @@ class BluezeroGATTServer:
 
         mtu = options.get("mtu", None)
 
-        self._log(f"Received {len(data)} bytes from {central_address} (MTU: {mtu})", "DEBUG")
+        if self.driver._log_enabled("DEBUG"):
+            self._log(f"Received {len(data)} bytes from {central_address} (MTU: {mtu})", "DEBUG")
 
         # Track central connection
         with self.centrals_lock:
@@ -2460,7 +2657,8 @@ class BluezeroGATTServer:
         # Update characteristic value (bluezero automatically sends notification)
         self.tx_characteristic.set_value(value)
 
-        self._log(f"Sent notification: {len(data)} bytes to {central_address}", "DEBUG")
+        if self.driver._log_enabled("DEBUG"):
+            self._log(f"Sent notification: {len(data)} bytes to {central_address}", "DEBUG")
 
 
 # ============================================================================
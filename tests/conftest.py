@@ -57,6 +57,9 @@ if os.path.exists(os.path.join(rns_stub_path, '__init__.py')):
                 pass
             RNS.log = mock_log
 
+        if not hasattr(RNS, 'loglevel'):
+            RNS.loglevel = RNS.LOG_NOTICE
+
         if not hasattr(RNS, 'prettyhexrep'):
             def mock_prettyhexrep(data):
                 return data.hex() if isinstance(data, bytes) else str(data)
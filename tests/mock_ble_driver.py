@@ -37,7 +37,6 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from RNS.Interfaces.bluetooth_driver import BLEDriverInterface, BLEDevice, DriverState
 from typing import List, Optional, Callable, Dict
-import time
 
 
 class MockBLEDriver(BLEDriverInterface):
@@ -54,7 +53,11 @@ class MockBLEDriver(BLEDriverInterface):
         """
         self.local_address = local_address
         self._state = DriverState.IDLE
-        self._connected_peers: Dict[str, dict] = {}  # address -> {role, mtu, identity}
+        # Per-peer connection state, one dict per field keyed by address.
+        # _peer_role doubles as the membership/ordering map for connected peers.
+        self._peer_role: Dict[str, str] = {}  # address -> "central" | "peripheral"
+        self._peer_mtu: Dict[str, int] = {}  # address -> negotiated MTU
+        self._peer_identity: Dict[str, Optional[bytes]] = {}  # address -> identity
         self._identity: Optional[bytes] = None
         self._service_discovery_delay: float = 0.0  # No delay in mock
         self._power_mode: str = "balanced"
@@ -75,6 +78,7 @@ class MockBLEDriver(BLEDriverInterface):
 
         # Linked driver for bidirectional communication testing
         self._linked_driver: Optional['MockBLEDriver'] = None
+        self._linked_address: Optional[str] = None  # _linked_driver.local_address
 
         # Simulated characteristics storage
         self._characteristics: Dict[str, bytes] = {}  # char_uuid -> value
@@ -94,8 +98,7 @@ class MockBLEDriver(BLEDriverInterface):
 
     def stop(self):
         """Stop all activity and disconnect all peers."""
-        for address in list(self._connected_peers.keys()):
-            self.disconnect(address)
+        self._bulk_disconnect()
         self._state = DriverState.IDLE
 
     def set_identity(self, identity_bytes: bytes):
@@ -113,7 +116,7 @@ class MockBLEDriver(BLEDriverInterface):
     @property
     def connected_peers(self) -> List[str]:
         """Return list of connected peer addresses."""
-        return list(self._connected_peers.keys())
+        return list(self._peer_role)
 
     # --- Core Actions ---
 
@@ -144,15 +147,11 @@ class MockBLEDriver(BLEDriverInterface):
         If a linked driver is set and its address matches, establishes
         a bidirectional connection.
         """
-        if address in self._connected_peers:
+        if address in self._peer_role:
             return  # Already connected
 
         # Simulate connection with default MTU
-        self._connected_peers[address] = {
-            "role": "central",
-            "mtu": 185,  # Default MTU
-            "identity": None
-        }
+        self._add_peer(address, "central")
 
         # Trigger callback
         if self.on_device_connected:
@@ -163,7 +162,7 @@ class MockBLEDriver(BLEDriverInterface):
             self.on_mtu_negotiated(address, 185)
 
         # If linked driver exists and address matches, establish reverse connection
-        if self._linked_driver and self._linked_driver.local_address == address:
+        if address == self._linked_address:
             self._linked_driver._accept_connection(self.local_address)
 
     def _accept_connection(self, address: str):
@@ -171,14 +170,10 @@ class MockBLEDriver(BLEDriverInterface):
         Internal: Accept incoming connection (peripheral role).
         Called by linked driver when it connects to us.
         """
-        if address in self._connected_peers:
+        if address in self._peer_role:
             return
 
-        self._connected_peers[address] = {
-            "role": "peripheral",
-            "mtu": 185,
-            "identity": None
-        }
+        self._add_peer(address, "peripheral")
 
         if self.on_device_connected:
             self.on_device_connected(address)
@@ -186,33 +181,64 @@ class MockBLEDriver(BLEDriverInterface):
         if self.on_mtu_negotiated:
             self.on_mtu_negotiated(address, 185)
 
+    def _add_peer(self, address: str, role: str, mtu: int = 185):
+        """Internal: Record a new connection (default MTU, identity unknown)."""
+        self._peer_role[address] = role
+        self._peer_mtu[address] = mtu
+        self._peer_identity[address] = None
+
+    def _remove_peer(self, address: str) -> Optional[str]:
+        """Internal: Forget a connection. Returns its role, or None if not connected."""
+        role = self._peer_role.pop(address, None)
+        if role is not None:
+            del self._peer_mtu[address]
+            del self._peer_identity[address]
+        return role
+
     def disconnect(self, address: str):
         """Disconnect from a peer."""
-        if address not in self._connected_peers:
+        role = self._remove_peer(address)
+        if role is None:
             return
 
-        # Remove peer
-        role = self._connected_peers[address]["role"]
-        del self._connected_peers[address]
-
         # Trigger callback
         if self.on_device_disconnected:
             self.on_device_disconnected(address)
 
         # If linked, trigger disconnect on other side
-        if self._linked_driver and self._linked_driver.local_address == address:
+        if address == self._linked_address:
             if role == "central":
                 self._linked_driver._handle_disconnect(self.local_address)
             else:
                 self._linked_driver._handle_disconnect(self.local_address)
 
+    def _bulk_disconnect(self):
+        """
+        Internal: Disconnect every peer at once.
+
+        Clears the per-peer maps in one go, then fires on_device_disconnected
+        for each former peer. The linked driver (at most one address) is told once.
+        """
+        addresses = tuple(self._peer_role)
+        if not addresses:
+            return
+
+        self._peer_role.clear()
+        self._peer_mtu.clear()
+        self._peer_identity.clear()
+
+        if self.on_device_disconnected:
+            for address in addresses:
+                self.on_device_disconnected(address)
+
+        if self._linked_address in addresses:
+            self._linked_driver._handle_disconnect(self.local_address)
+
     def _handle_disconnect(self, address: str):
         """Internal: Handle disconnection initiated by peer."""
-        if address not in self._connected_peers:
+        if self._remove_peer(address) is None:
             return
 
-        del self._connected_peers[address]
-
         if self.on_device_disconnected:
             self.on_device_disconnected(address)
 
@@ -222,16 +248,17 @@ class MockBLEDriver(BLEDriverInterface):
 
         Role-aware: automatically routes to linked driver's on_data_received.
         """
-        if address not in self._connected_peers:
+        if address not in self._peer_role:
             raise ConnectionError(f"Not connected to {address}")
 
         # Track for assertions
         self.sent_data.append((address, data))
 
         # If linked driver exists, deliver data
-        if self._linked_driver and self._linked_driver.local_address == address:
-            if self._linked_driver.on_data_received:
-                self._linked_driver.on_data_received(self.local_address, data)
+        if address == self._linked_address:
+            on_data_received = self._linked_driver.on_data_received
+            if on_data_received:
+                on_data_received(self.local_address, data)
 
     # --- GATT Characteristic Operations ---
 
@@ -241,11 +268,11 @@ class MockBLEDriver(BLEDriverInterface):
 
         If linked driver exists, reads from its characteristics.
         """
-        if address not in self._connected_peers:
+        if address not in self._peer_role:
             raise ConnectionError(f"Not connected to {address}")
 
         # If linked driver, read from its characteristics
-        if self._linked_driver and self._linked_driver.local_address == address:
+        if address == self._linked_address:
             if char_uuid in self._linked_driver._characteristics:
                 return self._linked_driver._characteristics[char_uuid]
             else:
@@ -263,11 +290,11 @@ class MockBLEDriver(BLEDriverInterface):
 
         If linked driver exists, writes to its characteristics.
         """
-        if address not in self._connected_peers:
+        if address not in self._peer_role:
             raise ConnectionError(f"Not connected to {address}")
 
         # If linked driver, write to its characteristics
-        if self._linked_driver and self._linked_driver.local_address == address:
+        if address == self._linked_address:
             self._linked_driver._characteristics[char_uuid] = data
         else:
             # For testing without linked driver
@@ -279,7 +306,7 @@ class MockBLEDriver(BLEDriverInterface):
 
         In the mock, this is a no-op since data delivery is automatic via send().
         """
-        if address not in self._connected_peers:
+        if address not in self._peer_role:
             raise ConnectionError(f"Not connected to {address}")
         # In mock, notifications are handled automatically via send()
         pass
@@ -335,10 +362,10 @@ class MockBLEDriver(BLEDriverInterface):
             address: Peer address
             new_mtu: New MTU value
         """
-        if address not in self._connected_peers:
+        if address not in self._peer_mtu:
             return
 
-        self._connected_peers[address]["mtu"] = new_mtu
+        self._peer_mtu[address] = new_mtu
 
         if self.on_mtu_negotiated:
             self.on_mtu_negotiated(address, new_mtu)
@@ -365,9 +392,7 @@ class MockBLEDriver(BLEDriverInterface):
         Returns:
             "central" or "peripheral", or None if not connected
         """
-        if address in self._connected_peers:
-            return self._connected_peers[address]["role"]
-        return None
+        return self._peer_role.get(address)
 
     @staticmethod
     def link_drivers(driver1: 'MockBLEDriver', driver2: 'MockBLEDriver'):
@@ -383,6 +408,8 @@ class MockBLEDriver(BLEDriverInterface):
         """
         driver1._linked_driver = driver2
         driver2._linked_driver = driver1
+        driver1._linked_address = driver2.local_address
+        driver2._linked_address = driver1.local_address
 
     def reset(self):
         """Reset the mock driver to initial state (useful between tests)."""
@@ -36,9 +36,9 @@ def create_mock_peer_interface(peer_address="AA:BB:CC:DD:EE:FF", peer_name="Test
     parent.peers = {peer_address: (Mock(is_connected=True), 0, 185)}
     parent.fragmenters = {peer_address: BLEFragmenter(mtu=185) if BLEFragmenter else Mock()}
     parent.reassemblers = {peer_address: BLEReassembler() if BLEReassembler else Mock()}
-    parent.frag_lock = asyncio.Lock()
-    parent.peer_lock = asyncio.Lock()
-    parent.loop = asyncio.get_event_loop()
+    parent.frag_lock = MagicMock()  # No test here awaits or contends on the locks
+    parent.peer_lock = MagicMock()
+    parent.loop = None  # Avoid get_event_loop() outside a running loop
     parent.gatt_server = Mock()
     parent.gatt_server.send_notification = AsyncMock(return_value=True)
 
@@ -117,6 +117,41 @@ class TestBLEFragmenter:
         assert overhead == 3 * 5  # 3 fragments * 5 byte header
         assert pct == (15 / 500) * 100
 
+    def test_single_fragment_header(self):
+        """Single-fragment packets use the precomputed START 0/1 header"""
+        import struct
+        fragmenter = BLEFragmenter(mtu=185)
+        packet = b"L" * fragmenter.payload_size
+
+        fragments = fragmenter.fragment_packet(packet)
+
+        assert len(fragments) == 1
+        assert BLEFragmenter.SINGLE_FRAGMENT_HEADER == struct.pack("!BHH", BLEFragmenter.TYPE_START, 0, 1)
+        assert fragments[0] == BLEFragmenter.SINGLE_FRAGMENT_HEADER + packet
+        assert BLEReassembler().receive_fragment(fragments[0], "device1") == packet
+
+    def test_fragment_single(self):
+        """fragment_single matches fragment_packet and declines packets that need more"""
+        fragmenter = BLEFragmenter(mtu=185)
+        packet = b"S" * fragmenter.payload_size
+
+        assert fragmenter.fragment_single(packet) == fragmenter.fragment_packet(packet)[0]
+        assert fragmenter.fragment_single(packet + b"S") is None
+        assert fragmenter.fragment_single(b"") is None
+        assert fragmenter.fragment_single(bytearray(b"S")) is None
+
+    def test_set_mtu_updates_in_place(self):
+        """MTU renegotiation should resize fragments without a new fragmenter"""
+        fragmenter = BLEFragmenter(mtu=23)
+        packet = b"M" * 300
+        assert len(fragmenter.fragment_packet(packet)) == 17
+
+        fragmenter.set_mtu(185)
+
+        assert fragmenter.mtu == 185
+        assert fragmenter.payload_size == 180
+        assert len(fragmenter.fragment_packet(packet)) == 2
+
     def test_empty_packet_error(self):
         """Empty packets should raise ValueError"""
         fragmenter = BLEFragmenter(mtu=185)
@@ -251,6 +286,45 @@ class TestBLEReassembler:
         assert stats['fragments_received'] == len(fragments)
         assert stats['pending_packets'] == 0
 
+    def test_reset_for_reuse(self):
+        """Reset should drop pending buffers and statistics"""
+        fragmenter = BLEFragmenter(mtu=100)
+        reassembler = BLEReassembler()
+
+        fragments = fragmenter.fragment_packet(b"I" * 300)
+        reassembler.receive_fragment(fragments[0], "device1")
+        assert len(reassembler.reassembly_buffers) == 1
+
+        reassembler.reset()
+
+        assert len(reassembler.reassembly_buffers) == 0
+        assert reassembler.get_statistics()['fragments_received'] == 0
+
+    def test_pending_buffers_bounded(self):
+        """Oldest incomplete packet is evicted when max_pending is reached"""
+        fragmenter = BLEFragmenter(mtu=100)
+        reassembler = BLEReassembler(max_pending=2)
+
+        for sender in ("device1", "device2", "device3"):
+            fragments = fragmenter.fragment_packet(b"J" * 300)
+            assert reassembler.receive_fragment(fragments[0], sender) is None
+
+        assert len(reassembler.reassembly_buffers) == 2
+        assert reassembler.get_statistics()['packets_evicted'] == 1
+        assert all(key[0] != "device1" for key in reassembler.reassembly_buffers)
+
+    def test_reset_drops_pending_buffers(self):
+        """reset releases in-progress buffers and reports how many"""
+        fragmenter = BLEFragmenter(mtu=100)
+        reassembler = BLEReassembler()
+
+        fragments = fragmenter.fragment_packet(b"K" * 300)
+        reassembler.receive_fragment(fragments[0], "device1")
+        reassembler.receive_fragment(fragments[1], "device2")
+
+        assert reassembler.reset() == 2
+        assert len(reassembler.reassembly_buffers) == 0
+
 
 class TestHDLCFramer:
     """Test HDLC framing (alternative to fragmentation)"""
@@ -0,0 +1,245 @@
+"""
+Unit tests for the LinuxBluetoothDriver central-role TX pump.
+
+Central-role send()/send_fragments() queue packets per peer; a pump task on
+the driver's event loop writes them with client.write_gatt_char. These tests
+run a real event loop in a background thread (as the driver does) and mock
+only the BleakClient, covering ordering, the bounded queue, write timeouts,
+cancellation on stop() and disconnect/reconnect.
+"""
+
+import pytest
+import asyncio
+import threading
+import time
+from unittest.mock import Mock, AsyncMock, patch
+
+try:
+    from RNS.Interfaces import linux_bluetooth_driver
+    from RNS.Interfaces.linux_bluetooth_driver import LinuxBluetoothDriver, PeerConnection
+except ImportError:
+    linux_bluetooth_driver = None
+
+
+PEER = "AA:BB:CC:DD:EE:FF"
+RX_CHAR_UUID = "6e400002-b5a3-f393-e0a9-e50e24dcca9e"
+
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+def create_driver():
+    """Create a driver with a running event loop thread and no BlueZ access."""
+    with patch.object(linux_bluetooth_driver, 'HAS_BLEAK', True), \
+            patch.object(linux_bluetooth_driver, 'apply_bluez_services_resolved_patch'), \
+            patch.object(LinuxBluetoothDriver, '_detect_bluez_version'):
+        driver = LinuxBluetoothDriver()
+
+    driver.rx_char_uuid = RX_CHAR_UUID
+    driver.loop = asyncio.new_event_loop()
+    driver.loop_thread = threading.Thread(target=driver.loop.run_forever, daemon=True)
+    driver.loop_thread.start()
+    driver._running = True
+    return driver
+
+
+def shutdown_driver(driver):
+    """Stop and close the driver's event loop (if stop() has not already)."""
+    if driver.loop.is_running():
+        asyncio.run_coroutine_threadsafe(driver._cancel_tx_pumps(), driver.loop).result(timeout=2.0)
+        driver.loop.call_soon_threadsafe(driver.loop.stop)
+    driver.loop_thread.join(timeout=2.0)
+    driver.loop.close()
+
+
+def create_client(hang=None):
+    """
+    Create a mock BleakClient recording writes.
+
+    Args:
+        hang: Optional predicate on the written data; matching writes block
+            until cancelled (records "cancelled" when they are)
+    """
+    client = Mock()
+    client.written = []
+    client.cancelled = []
+
+    async def write_gatt_char(uuid, data, response=False):
+        if hang is not None and hang(data):
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                client.cancelled.append(data)
+                raise
+        client.written.append(data)
+
+    client.write_gatt_char = AsyncMock(side_effect=write_gatt_char)
+    client.disconnect = AsyncMock()
+    return client
+
+
+def connect_central(driver, client, address=PEER):
+    """Register a central-role connection with the given client."""
+    driver._peers[address] = PeerConnection(address=address, client=client, mtu=185,
+                                            connection_type="central")
+
+
+def wait_for(condition, timeout=2.0):
+    """Poll until condition() is true (the pump runs on another thread)."""
+    deadline = time.time() + timeout
+    while not condition():
+        if time.time() > deadline:
+            raise AssertionError("condition not met before timeout")
+        time.sleep(0.005)
+
+
+def wait_idle(driver):
+    """Wait until every queued write has been handled."""
+    # Let already scheduled enqueues run first, so their pumps exist
+    asyncio.run_coroutine_threadsafe(asyncio.sleep(0), driver.loop).result(timeout=2.0)
+    wait_for(lambda: not driver._tx_pumps and not driver._tx_queues)
+
+
+@pytest.fixture
+def driver():
+    if linux_bluetooth_driver is None:
+        pytest.skip("linux_bluetooth_driver not available")
+    driver = create_driver()
+    yield driver
+    shutdown_driver(driver)
+
+
+# ============================================================================
+# TX Pump Tests
+# ============================================================================
+
+class TestCentralTxPump:
+    """Test queued central-role GATT writes."""
+
+    def test_packets_written_in_order(self, driver):
+        """Packets and the fragments within them are written in send order."""
+        client = create_client()
+        connect_central(driver, client)
+
+        driver.send(PEER, b"one")
+        driver.send_fragments(PEER, [b"two-a", b"two-b", b"two-c"])
+        driver.send(PEER, b"three")
+        wait_idle(driver)
+
+        assert client.written == [b"one", b"two-a", b"two-b", b"two-c", b"three"]
+        assert all(call.args[0] == RX_CHAR_UUID for call in client.write_gatt_char.call_args_list)
+        assert driver.tx_dropped == 0
+
+    def test_queue_full_drops_packet(self, driver):
+        """Packets beyond TX_QUEUE_SIZE are dropped and counted."""
+        driver.TX_QUEUE_SIZE = 2
+        client = create_client(hang=lambda data: data == b"first")
+        connect_central(driver, client)
+
+        driver.send(PEER, b"first")
+        wait_for(lambda: client.write_gatt_char.await_count == 1)  # Pump is blocked on it
+
+        for data in (b"second", b"third", b"fourth"):
+            driver.send(PEER, data)
+        wait_for(lambda: driver.tx_dropped == 1)
+
+        assert list(driver._tx_queues[PEER]) == [(b"second",), (b"third",)]
+
+    def test_timeout_discards_queue_and_raises_on_next_send(self, driver):
+        """A timed-out write discards the peer's queue and fails the next send()."""
+        driver.TX_WRITE_TIMEOUT = 0.05
+        client = create_client(hang=lambda data: data == b"stuck")
+        connect_central(driver, client)
+
+        driver.send(PEER, b"stuck")
+        wait_for(lambda: client.write_gatt_char.await_count == 1)
+        driver.send(PEER, b"queued-1")
+        driver.send(PEER, b"queued-2")
+        wait_idle(driver)
+
+        assert client.cancelled == [b"stuck"]
+        assert client.written == []
+        assert driver.tx_dropped == 2
+
+        with pytest.raises(RuntimeError, match="timed out"):
+            driver.send(PEER, b"next")
+
+        # The error is reported once; later sends are queued again
+        driver.send(PEER, b"after")
+        wait_idle(driver)
+        assert client.written == [b"after"]
+
+    def test_write_errors_do_not_block_other_peers(self, driver):
+        """A stuck peer only delays its own packets."""
+        other = "11:22:33:44:55:66"
+        stuck_client = create_client(hang=lambda data: True)
+        other_client = create_client()
+        connect_central(driver, stuck_client)
+        connect_central(driver, other_client, address=other)
+
+        driver.send(PEER, b"stuck")
+        wait_for(lambda: stuck_client.write_gatt_char.await_count == 1)
+        driver.send(other, b"hello")
+        wait_for(lambda: other_client.written == [b"hello"])
+
+        assert PEER in driver._tx_pumps
+
+    def test_stop_cancels_pending_writes(self, driver):
+        """stop() cancels in-flight writes and discards queued packets."""
+        client = create_client(hang=lambda data: data == b"stuck")
+        connect_central(driver, client)
+
+        driver.send(PEER, b"stuck")
+        wait_for(lambda: client.write_gatt_char.await_count == 1)
+        driver.send(PEER, b"queued")
+        wait_for(lambda: len(driver._tx_queues.get(PEER, ())) == 1)
+
+        driver.stop()
+
+        assert client.cancelled == [b"stuck"]
+        assert client.written == []
+        assert driver._tx_pumps == {}
+        assert driver._tx_queues == {}
+        assert driver.tx_dropped == 1
+
+    def test_cancel_tx_pumps(self, driver):
+        """_cancel_tx_pumps cancels every pump, including ones not yet started."""
+        client = create_client(hang=lambda data: True)
+        connect_central(driver, client)
+        connect_central(driver, client, address="11:22:33:44:55:66")
+
+        driver.send(PEER, b"stuck")
+        driver.send(PEER, b"queued")
+        driver.send("11:22:33:44:55:66", b"stuck")
+
+        asyncio.run_coroutine_threadsafe(driver._cancel_tx_pumps(), driver.loop).result(timeout=2.0)
+
+        assert driver._tx_pumps == {}
+        assert driver._tx_queues == {}
+
+    def test_reconnect_uses_new_client_without_stale_error(self, driver):
+        """After disconnect and reconnect, old queued packets and errors are gone."""
+        old_client = create_client(hang=lambda data: True)
+        connect_central(driver, old_client)
+
+        driver.send(PEER, b"old-stuck")
+        wait_for(lambda: old_client.write_gatt_char.await_count == 1)
+        driver.send(PEER, b"old-queued")
+
+        driver.disconnect(PEER)
+        wait_idle(driver)
+
+        assert old_client.cancelled == [b"old-stuck"]
+        assert driver.tx_dropped == 1
+
+        new_client = create_client()
+        connect_central(driver, new_client)
+
+        driver.send(PEER, b"new-1")
+        driver.send(PEER, b"new-2")
+        wait_idle(driver)
+
+        assert new_client.written == [b"new-1", b"new-2"]
+        assert old_client.written == []
+        assert driver._tx_errors == {}
@@ -36,7 +36,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
 
 # Mock RNS module before importing BLEInterface
-from unittest.mock import Mock, MagicMock
+from unittest.mock import Mock, MagicMock, patch
 import sys as _sys
 
 # Create RNS mock structure
@@ -369,5 +369,136 @@ class TestCombinedProtection:
         assert len(attempts) <= 2  # Allow small window before protection kicks in
 
 
+class TestBlacklistExpiry:
+    """Test that blacklist entries expire however they were recorded."""
+
+    def create_interface(self):
+        driver = MockBLEDriver(local_address="AA:BB:CC:DD:EE:FF")
+        owner = MockOwner()
+
+        config = {"name": "Test", "enable_central": True}
+        interface = BLEInterface(owner, config)
+        interface.driver = driver
+        interface.local_address = driver.local_address
+        return interface
+
+    def blacklist(self, interface, address):
+        """Record failures until the peer is blacklisted."""
+        for _ in range(interface.max_connection_failures):
+            interface._record_connection_failure(address)
+        assert address in interface.connection_blacklist
+
+    def test_direct_blacklist_write_expires(self):
+        """An entry written straight into connection_blacklist still expires."""
+        interface = self.create_interface()
+        peer_address = "BB:22:33:44:55:66"
+
+        interface.connection_blacklist[peer_address] = (time.time() + 60, 3)
+        assert interface._is_blacklisted(peer_address)
+
+        interface.connection_blacklist[peer_address] = (time.time() - 1, 3)
+        assert not interface._is_blacklisted(peer_address)
+        assert peer_address not in interface.connection_blacklist
+
+    def test_reblacklisted_peer_not_removed_by_stale_heap_entry(self):
+        """Re-blacklisting sets a new expiry the old heap entry cannot cut short."""
+        interface = self.create_interface()
+        peer_address = "BB:22:33:44:55:66"
+        interface.discovered_peers[peer_address] = DiscoveredPeer(peer_address, "TestPeer", -60)
+
+        start = time.time()
+        with patch.object(time, "time", return_value=start):
+            self.blacklist(interface, peer_address)
+            first_until = interface.connection_blacklist[peer_address][0]
+
+            # One more failure doubles the backoff
+            interface._record_connection_failure(peer_address)
+            second_until = interface.connection_blacklist[peer_address][0]
+
+        assert second_until > first_until
+        assert len(interface._blacklist_expiry_heap) == 2
+
+        # Past the first expiry only: the stale heap entry is discarded
+        with patch.object(time, "time", return_value=first_until + 1):
+            interface._sweep_blacklist()
+            assert interface.connection_blacklist[peer_address][0] == second_until
+            assert interface._is_blacklisted(peer_address)
+
+        # Past the second expiry: the entry is purged
+        with patch.object(time, "time", return_value=second_until + 1):
+            interface._sweep_blacklist()
+        assert peer_address not in interface.connection_blacklist
+        assert interface._blacklist_expiry_heap == []
+
+    def test_expired_entry_gone_after_select_peers(self):
+        """An expired blacklist entry is purged and the peer selected again."""
+        interface = self.create_interface()
+        peer_address = "BB:22:33:44:55:66"
+        interface.discovered_peers[peer_address] = DiscoveredPeer(peer_address, "TestPeer", -60)
+
+        start = time.time()
+        with patch.object(time, "time", return_value=start):
+            self.blacklist(interface, peer_address)
+            blacklist_until = interface.connection_blacklist[peer_address][0]
+            assert peer_address not in [p.address for p in interface._select_peers_to_connect()]
+
+        with patch.object(time, "time", return_value=blacklist_until + 1):
+            peers_to_connect = interface._select_peers_to_connect()
+
+        assert peer_address not in interface.connection_blacklist
+        assert peer_address in [p.address for p in peers_to_connect]
+
+
+class TestPeerSelectionCache:
+    """Test that the cached peer selection is dropped when connections change."""
+
+    def create_interface(self):
+        driver = MockBLEDriver(local_address="AA:BB:CC:DD:EE:FF")
+        owner = MockOwner()
+
+        config = {"name": "Test", "enable_central": True}
+        interface = BLEInterface(owner, config)
+        interface.driver = driver
+        interface.local_address = driver.local_address
+        return interface
+
+    def test_connect_drops_cached_selection(self):
+        """A completed connection invalidates the cached selection."""
+        interface = self.create_interface()
+        peer_address = "BB:22:33:44:55:66"
+        interface.discovered_peers[peer_address] = DiscoveredPeer(peer_address, "TestPeer", -60)
+
+        interface._peer_selection_cache = (time.monotonic(), frozenset([peer_address]))
+        interface._device_connected_callback(peer_address, bytes(range(16)))
+
+        assert interface._peer_selection_cache == (float("-inf"), frozenset())
+
+    def test_disconnect_drops_cached_selection(self):
+        """After a disconnect the next advert re-scores instead of reusing the cache."""
+        interface = self.create_interface()
+        peer_address = "BB:22:33:44:55:66"
+        peer = DiscoveredPeer(peer_address, "TestPeer", -60)
+        interface.discovered_peers[peer_address] = peer
+
+        # Selection made while the peer was connected (so it was not chosen)
+        interface._peer_selection_cache = (time.monotonic(), frozenset())
+        interface._device_disconnected_callback(peer_address)
+
+        assert interface._peer_selection_cache == (float("-inf"), frozenset())
+
+        device = type('obj', (object,), {
+            'address': peer_address,
+            'name': 'TestPeer',
+            'rssi': -60,
+            'service_uuids': [interface.service_uuid],
+            'manufacturer_data': {}
+        })()
+        interface._device_discovered_callback(device)
+
+        # Within PEER_SELECTION_TTL, yet the peer is selected and reconnected
+        assert peer.connection_attempts == 1
+        assert peer_address in interface.driver.connected_peers
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])